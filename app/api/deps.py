@@ -0,0 +1,76 @@
+import hashlib
+from typing import Final
+from uuid import UUID
+
+from fastapi import Depends, HTTPException, Request, Response
+from sqlalchemy import func, select
+from pydantic import BaseModel
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.cache import get_version, store_version
+from app.database import get_async_db
+
+# --- TEMPORARY USER UNTIL AUTH IS ADDED ---
+# Parsed once at import; every write endpoint depends on it.
+_SYSTEM_USER_ID: Final[UUID] = UUID("00000000-0000-0000-0000-000000000001")
+
+# Browsers (not shared proxies) may reuse a lookup response for a minute and
+# serve it stale while revalidating with If-None-Match for five more
+LOOKUP_CACHE_CONTROL: Final[str] = "private, max-age=60, stale-while-revalidate=300"
+
+
+# async so FastAPI calls it inline instead of dispatching a plain `def`
+# dependency to the threadpool on every request
+async def get_current_user_id() -> UUID:
+    return _SYSTEM_USER_ID
+
+
+def table_version(model):
+    """Row count plus newest write time of `model`, deleted rows included."""
+    # Soft deletes stamp updated_at, so deleted rows are counted too
+    return (
+        select(func.max(func.coalesce(model.updated_at, model.created_at)), func.count())
+        .select_from(model)
+        .execution_options(include_deleted=True)
+    )
+
+
+def lookup_version(namespace: str, model):
+    """
+    Dependency for lookup GETs: a token for the table's latest write, meant to
+    be part of the cache key so a write on any worker retires cached bodies.
+    """
+    async def current_version(db: AsyncSession = Depends(get_async_db)) -> str:
+        version, generation = get_version(namespace)
+        if version is None:
+            latest, total = (await db.execute(table_version(model))).one()
+            version = f"{total}-{latest.timestamp() if latest else 0}"
+            store_version(namespace, generation, version)
+        return version
+
+    return current_version
+
+
+def body_etag(body: BaseModel) -> str:
+    """Strong ETag for exactly the JSON this body serializes to."""
+    digest = hashlib.blake2b(body.model_dump_json().encode(), digest_size=16)
+    return f'"{digest.hexdigest()}"'
+
+
+def conditional_response(request: Request, response: Response, etag: str, body):
+    """
+    Return `body` with its ETag and Cache-Control set, or raise 304 when the
+    client's If-None-Match already names that ETag.
+    """
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match and (if_none_match.strip() == "*" or etag in (
+        tag.strip().removeprefix("W/") for tag in if_none_match.split(",")
+    )):
+        raise HTTPException(
+            status_code=304,
+            headers={"ETag": etag, "Cache-Control": LOOKUP_CACHE_CONTROL},
+        )
+
+    response.headers["ETag"] = etag
+    response.headers["Cache-Control"] = LOOKUP_CACHE_CONTROL
+    return body
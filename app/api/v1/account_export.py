@@ -1,13 +1,18 @@
-from typing import List
+from typing import Iterable
+from operator import attrgetter
 from fastapi import APIRouter, Depends, HTTPException
 from fastapi.responses import StreamingResponse
-from sqlalchemy.orm import Session, selectinload
-import io
+from sqlalchemy import select
+from sqlalchemy.orm import Session, selectinload, load_only
 import csv
-from openpyxl import Workbook
+import os
+import threading
 
-from app.database import get_db
+from app.database import SessionLocal, get_db
 from app.models.account import Account
+from app.models.address import Address
+from app.models.contact import Contact
+from app.models.lookup_models import Department, Unit, Vertical, Location, Status
 
 router = APIRouter(
     prefix="/accounts",
@@ -35,49 +40,155 @@ EXPORT_FIELDS = [
     "Contacts (Name/Email/Phone)",
 ]
 
+# Rows fetched per round-trip while streaming the export
+EXPORT_BATCH_SIZE = 1000
+
+# Bytes handed to the client per chunk of the streamed XLSX file
+XLSX_CHUNK_SIZE = 64 * 1024
+
+# Bound once; formats one contact as Name/Email/Phone
+CONTACT_FORMAT = "{}/{}/{}".format
+
 
 def serialize_contacts(acc: Account) -> str:
     """Serialize contacts into Name/Email/Phone; Name2/Email2/Phone2 format."""
     if not acc.contacts:
         return ""
 
-    parts = []
-    for c in acc.contacts:
-        name = c.name or ""
-        email = c.email or ""
-        phone = c.phone or ""
-        # keep 3 segments for consistency
-        parts.append(f"{name}/{email}/{phone}")
-    return "; ".join(parts)
+    # keep 3 segments for consistency
+    return "; ".join(
+        CONTACT_FORMAT(c.name or "", c.email or "", c.phone or "") for c in acc.contacts
+    )
+
 
+# Pre-bound getters for the EXPORT_FIELDS columns, in order
+ACC_GETTER = attrgetter("name", "code", "probability", "account_partner", "delivery_partner")
+LOOKUP_GETTER = attrgetter("department", "unit", "vertical", "location", "status")
+ADDR_GETTER = attrgetter("addressLine1", "addressLine2", "city", "state", "zip", "countryCode")
+NO_ADDRESS = (None,) * 6
 
-def serialize_account(acc: Account) -> dict:
-    """Convert Account model into a flat dict matching EXPORT_FIELDS."""
+
+def serialize_account(acc: Account) -> tuple:
+    """Convert Account model into a flat row ordered like EXPORT_FIELDS."""
     addr = acc.billing_address
 
-    return {
-        "Name": acc.name,
-        "Code": acc.code,
-        "Probability": acc.probability,
-        "Account Partner": acc.account_partner,
-        "Delivery Partner": acc.delivery_partner,
-        "Department": acc.department.name if getattr(acc, "department", None) else None,
-        "Unit": acc.unit.name if getattr(acc, "unit", None) else None,
-        "Vertical": acc.vertical.name if getattr(acc, "vertical", None) else None,
-        "Location": acc.location.name if getattr(acc, "location", None) else None,
-        "Status": acc.status.name if getattr(acc, "status", None) else None,
-        "Address Line1": addr.addressLine1 if addr else None,
-        "Address Line2": addr.addressLine2 if addr else None,
-        "City": addr.city if addr else None,
-        "State": addr.state if addr else None,
-        "Zip": addr.zip if addr else None,
-        "Country": addr.countryCode if addr else None,
-        "Contacts (Name/Email/Phone)": serialize_contacts(acc),
-    }
+    return (
+        *ACC_GETTER(acc),
+        *[lookup.name if lookup is not None else None for lookup in LOOKUP_GETTER(acc)],
+        *(ADDR_GETTER(addr) if addr is not None else NO_ADDRESS),
+        serialize_contacts(acc),
+    )
+
+
+def iter_accounts(db: Session, stmt) -> Iterable[Account]:
+    """Yield accounts in keyset batches of EXPORT_BATCH_SIZE, ordered by id.
+
+    Each batch is its own query with its own selectin loads, so memory stays
+    bounded without a server-side cursor.
+    """
+    last_id = None
+    while True:
+        batch_stmt = stmt.order_by(Account.id).limit(EXPORT_BATCH_SIZE)
+        if last_id is not None:
+            batch_stmt = batch_stmt.where(Account.id > last_id)
+        batch = db.scalars(batch_stmt).all()
+        yield from batch
+        if len(batch) < EXPORT_BATCH_SIZE:
+            return
+        last_id = batch[-1].id
+
+
+def gen_rows(accounts):
+    """Yield the header row followed by one positional row per account."""
+    yield EXPORT_FIELDS
+    for acc in accounts:
+        yield serialize_account(acc)
+
+
+class Echo:
+    """File-like shim: csv.writer returns each formatted line instead of buffering it."""
+
+    def write(self, value):
+        return value
+
+
+def iter_csv(accounts):
+    """Yield CSV text one batch of rows at a time."""
+    writer = csv.writer(Echo())
+    chunk = []
+    for row in gen_rows(accounts):
+        chunk.append(writer.writerow(row))
+        if len(chunk) >= EXPORT_BATCH_SIZE:
+            yield "".join(chunk)
+            chunk = []
+    if chunk:
+        yield "".join(chunk)
+
+
+def iter_xlsx(stmt):
+    """Yield the XLSX file for the accounts `stmt` selects.
+
+    constant_memory keeps one row in memory and spills the rest to a temp
+    file, but the zip itself is only produced by wb.close(), so the first
+    byte goes out after every row has been written. Saving into a pipe from
+    a worker thread then streams the zip instead of holding it in memory.
+
+    Closing the generator closes the read end (the zip writer gets
+    BrokenPipeError) and sets a stop flag checked per row; either way the
+    worker is joined before the generator finishes.
+    """
+    # Imported on first XLSX export rather than at app startup
+    import xlsxwriter
+
+    read_fd, write_fd = os.pipe()
+    failure = []
+    # Set when the response is closed early; the worker checks it per row
+    stop = threading.Event()
+
+    def write_workbook():
+        try:
+            # The worker reads through its own session: the request's one is
+            # closed by get_db on its own schedule, whatever this thread is doing
+            with SessionLocal() as db, open(write_fd, "wb") as pipe:
+                # constant_memory flushes each row to the sheet's temp file as
+                # soon as the next one starts; cell values are written as-is
+                wb = xlsxwriter.Workbook(pipe, {
+                    "constant_memory": True,
+                    "strings_to_formulas": False,
+                    "strings_to_urls": False,
+                })
+                ws = wb.add_worksheet("Accounts")
+
+                for i, row in enumerate(gen_rows(iter_accounts(db, stmt))):
+                    if stop.is_set():
+                        return
+                    ws.write_row(i, 0, row)
+
+                wb.close()
+        except BrokenPipeError:
+            pass
+        except Exception as e:
+            failure.append(e)
+
+    worker = threading.Thread(target=write_workbook, daemon=True)
+    worker.start()
+
+    pipe = open(read_fd, "rb")
+    try:
+        yield from iter(lambda: pipe.read(XLSX_CHUNK_SIZE), b"")
+    finally:
+        # Also runs on GeneratorExit when the client goes away: the worker
+        # stops at the next row (or on the closed pipe) and is waited for
+        pipe.close()
+        stop.set()
+        worker.join()
+
+    if failure:
+        raise failure[0]
 
 
 @router.get("/export")
-async def export_accounts(
+def export_accounts(
     format: str = "xlsx",
     db: Session = Depends(get_db),
 ):
@@ -107,54 +218,54 @@ async def export_accounts(
     if format not in ("xlsx", "csv"):
         raise HTTPException(status_code=400, detail="format must be 'xlsx' or 'csv'")
 
-    accounts: List[Account] = (
-        db.query(Account)
+    # Iterate in batches; each batch gets its own selectin loads instead of
+    # materializing every account (and its relations) up front
+    stmt = (
+        select(Account)
         .options(
+            # only the columns the export writes (plus the lookup FKs)
+            load_only(
+                Account.name,
+                Account.code,
+                Account.probability,
+                Account.account_partner,
+                Account.delivery_partner,
+                Account.department_id,
+                Account.unit_id,
+                Account.vertical_id,
+                Account.location_id,
+                Account.status_id,
+            ),
             # lookups
-            selectinload(Account.department),
-            selectinload(Account.unit),
-            selectinload(Account.vertical),
-            selectinload(Account.location),
-            selectinload(Account.status),
+            selectinload(Account.department).load_only(Department.name),
+            selectinload(Account.unit).load_only(Unit.name),
+            selectinload(Account.vertical).load_only(Vertical.name),
+            selectinload(Account.location).load_only(Location.name),
+            selectinload(Account.status).load_only(Status.name),
             # address + contacts
-            selectinload(Account.billing_address),
-            selectinload(Account.contacts),
+            selectinload(Account.billing_address).load_only(
+                Address.addressLine1,
+                Address.addressLine2,
+                Address.city,
+                Address.state,
+                Address.zip,
+                Address.countryCode,
+            ),
+            selectinload(Account.contacts).load_only(Contact.name, Contact.email, Contact.phone),
         )
-        .filter(Account.is_deleted == False)
-        .all()
     )
-
-    rows = [serialize_account(acc) for acc in accounts]
-
     # Ensure we always have at least headers in export
     if format == "csv":
-        output = io.StringIO()
-        writer = csv.DictWriter(output, fieldnames=EXPORT_FIELDS)
-        writer.writeheader()
-        for row in rows:
-            writer.writerow(row)
-
         return StreamingResponse(
-            iter([output.getvalue()]),
+            iter_csv(iter_accounts(db, stmt)),
             media_type="text/csv",
             headers={"Content-Disposition": "attachment; filename=accounts.csv"},
         )
 
     # XLSX
     if format == "xlsx":
-        wb = Workbook()
-        ws = wb.active
-        ws.append(EXPORT_FIELDS)
-
-        for row in rows:
-            ws.append([row.get(col) for col in EXPORT_FIELDS])
-
-        stream = io.BytesIO()
-        wb.save(stream)
-        stream.seek(0)
-
         return StreamingResponse(
-            stream,
+            iter_xlsx(stmt),
             media_type="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
             headers={"Content-Disposition": "attachment; filename=accounts.xlsx"},
         )
@@ -1,12 +1,16 @@
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Iterator, Sequence, Tuple
 from uuid import UUID
+from itertools import batched
+from concurrent.futures import ThreadPoolExecutor
 import csv
 import io
 
 from fastapi import APIRouter, UploadFile, File, Depends, HTTPException
-from sqlalchemy.orm import Session
-from openpyxl import load_workbook
+from fastapi.concurrency import run_in_threadpool
+from sqlalchemy import func, insert, inspect, select
+from sqlalchemy.orm import Session, selectinload
 
+from app.api.deps import get_current_user_id
 from app.database import get_db
 from app.models.account import Account
 from app.models.address import Address
@@ -20,28 +24,98 @@ router = APIRouter(
 )
 
 
-# TEMP — replace later
-def get_current_user_id() -> UUID:
-    return UUID("00000000-0000-0000-0000-000000000001")
+# One parsed file row (CSV list / XLSX tuple), addressed by column index
+Row = Sequence[Any]
+
+# Rows written per transaction commit
+IMPORT_BATCH_SIZE = 500
 
 
 # -------------------------------------------------------
 # Helper: lookup by NAME
 # -------------------------------------------------------
-def resolve_lookup_by_name(db: Session, model, name: str | None, label: str):
-    """Return model.id for given name OR None if blank."""
+# Import column label -> lookup model
+LOOKUP_MODELS = {
+    "Department": Department,
+    "Unit": Unit,
+    "Vertical": Vertical,
+    "Location": Location,
+    "Status": Status,
+}
+
+
+# (version, maps) of the last lookup snapshot loaded; shared across imports
+_lookup_cache: Tuple[Tuple[Any, ...], Dict[str, Dict[str, UUID]]] | None = None
+
+
+def lookup_version(db: Session) -> Tuple[Any, ...]:
+    """Row count + latest change time of every lookup table, in one query."""
+    # Deleted rows included, as in table_version: a soft delete stamps
+    # updated_at, so it still changes the version
+    columns = []
+    for model in LOOKUP_MODELS.values():
+        columns.append(select(func.count()).select_from(model).scalar_subquery())
+        columns.append(
+            select(func.max(func.coalesce(model.updated_at, model.created_at))).scalar_subquery()
+        )
+    return tuple(db.execute(select(*columns).execution_options(include_deleted=True)).one())
+
+
+def load_lookup_maps(db: Session) -> Dict[str, Dict[str, UUID]]:
+    """
+    Name -> id map of every active lookup, per lookup label.
+
+    Lookups change rarely, so the maps are reused across imports until the
+    lookup tables' version changes (any create, update or soft delete bumps it).
+    """
+    global _lookup_cache
+
+    version = lookup_version(db)
+    if _lookup_cache is not None and _lookup_cache[0] == version:
+        return _lookup_cache[1]
+
+    maps = {
+        label: dict(
+            db.query(model.name, model.id).all()
+        )
+        for label, model in LOOKUP_MODELS.items()
+    }
+    _lookup_cache = (version, maps)
+    return maps
+
+
+def resolve_lookup_by_name(maps: Dict[str, Dict[str, UUID]], name: str | None, label: str):
+    """Return the lookup id for given name OR None if blank."""
     if not name:
         return None
 
-    obj = db.query(model).filter(
-        model.name == name.strip(),
-        model.is_deleted == False
-    ).first()
+    lookup_id = maps[label].get(name.strip())
 
-    if not obj:
+    if not lookup_id:
         raise ValueError(f"{label} '{name}' does not exist")
 
-    return obj.id
+    return lookup_id
+
+
+# -------------------------------------------------------
+# Helper: existing accounts by CODE
+# -------------------------------------------------------
+def load_existing_accounts(db: Session, rows: List[Dict[str, Any]]) -> Dict[str, Account]:
+    """Fetch every active account whose code appears in the batch, with its address."""
+    codes = {row["account"]["code"] for row in rows}
+    if not codes:
+        return {}
+
+    # include_deleted lets a soft-deleted address load too: its row still
+    # holds the account_id primary key, so it is restored rather than
+    # inserted again. Accounts stay filtered to live rows explicitly.
+    accounts = db.query(Account).options(
+        selectinload(Account.billing_address)
+    ).filter(
+        Account.code.in_(codes), Account.is_deleted == False
+    ).execution_options(include_deleted=True).all()
+
+    return {acc.code: acc for acc in accounts}
 
 
 # -------------------------------------------------------
@@ -86,50 +160,78 @@ def parse_contacts(raw: str | None):
 
 
 # -------------------------------------------------------
-# CREATE or UPDATE row
+# File parsers (header -> column index, then one row tuple at a time)
 # -------------------------------------------------------
-def process_import_row(db: Session, row: dict, user_id: UUID):
+def column_indices(header_row: Row | None) -> Dict[str, int]:
+    """Map each (stripped) header label to its column position."""
+    if not header_row:
+        return {}
+    return {str(label).strip(): i for i, label in enumerate(header_row) if label}
+
+
+def cell_value(row: Row, cols: Dict[str, int], label: str):
+    """Return the row's value for a header label, or None if the column is absent."""
+    i = cols.get(label)
+    return row[i] if i is not None and i < len(row) else None
+
+
+def read_csv_rows(content: bytes) -> Tuple[Dict[str, int], Iterator[Row]]:
+    reader = csv.reader(io.StringIO(content.decode("utf-8")))
+    cols = column_indices(next(reader, None))
+    # csv.reader yields [] for blank lines; skip them like DictReader does
+    return cols, (r for r in reader if r)
+
+
+def read_xlsx_rows(content: bytes) -> Tuple[Dict[str, int], Iterator[Row]]:
+    # openpyxl is the slowest import in the app; only XLSX uploads need it
+    from openpyxl import load_workbook
+
+    wb = load_workbook(io.BytesIO(content), read_only=True)
+    rows = wb.active.iter_rows(values_only=True)
+    cols = column_indices(next(rows, None))
+    return cols, rows
+
+
+# -------------------------------------------------------
+# Validate row (pure Python, no DB access)
+# -------------------------------------------------------
+def validate_import_row(
+    row: Row,
+    cols: Dict[str, int],
+    maps: Dict[str, Dict[str, UUID]],
+) -> Dict[str, Any]:
     """
-    Handles both:
-    - CREATE new account
-    - UPDATE existing account (matched by Code)
+    Clean and validate one file row, resolving lookup names via the
+    preloaded maps. Returns the row's account / address / contact values,
+    or raises ValueError - so an invalid row never reaches the DB.
     """
 
     # -------- Required fields --------
-    name = null_if_empty(row.get("Name"))
-    code = null_if_empty(row.get("Code"))
+    name = null_if_empty(cell_value(row, cols, "Name"))
+    code = null_if_empty(cell_value(row, cols, "Code"))
 
     if not name:
         raise ValueError("Name is required")
     if not code:
         raise ValueError("Code is required")
 
-    # Does account already exist?
-    account = db.query(Account).filter(
-        Account.code == code,
-        Account.is_deleted == False
-    ).first()
-
-    is_update = account is not None
-
     # -------- Optional simple fields --------
-    probability = null_if_empty(row.get("Probability"))
+    probability = null_if_empty(cell_value(row, cols, "Probability"))
     probability = int(probability) if probability else None
 
-    account_partner = null_if_empty(row.get("Account Partner"))
-    delivery_partner = null_if_empty(row.get("Delivery Partner"))
+    account_partner = null_if_empty(cell_value(row, cols, "Account Partner"))
+    delivery_partner = null_if_empty(cell_value(row, cols, "Delivery Partner"))
 
     # -------- Lookup fields (by NAME) --------
-    department_id = resolve_lookup_by_name(db, Department, null_if_empty(row.get("Department")), "Department")
-    unit_id = resolve_lookup_by_name(db, Unit, null_if_empty(row.get("Unit")), "Unit")
-    vertical_id = resolve_lookup_by_name(db, Vertical, null_if_empty(row.get("Vertical")), "Vertical")
-    location_id = resolve_lookup_by_name(db, Location, null_if_empty(row.get("Location")), "Location")
-    status_id = resolve_lookup_by_name(db, Status, null_if_empty(row.get("Status")), "Status")
+    lookup_ids = {
+        f"{label.lower()}_id": resolve_lookup_by_name(maps, null_if_empty(cell_value(row, cols, label)), label)
+        for label in LOOKUP_MODELS
+    }
 
     # -------- Address fields --------
-    line1 = null_if_empty(row.get("Address Line1"))
-    city = null_if_empty(row.get("City"))
-    country = null_if_empty(row.get("Country"))
+    line1 = null_if_empty(cell_value(row, cols, "Address Line1"))
+    city = null_if_empty(cell_value(row, cols, "City"))
+    country = null_if_empty(cell_value(row, cols, "Country"))
 
     if not line1:
         raise ValueError("Address Line1 is required")
@@ -138,167 +240,238 @@ def process_import_row(db: Session, row: dict, user_id: UUID):
     if not country:
         raise ValueError("Country is required")
 
-    line2 = null_if_empty(row.get("Address Line2"))
-    state = null_if_empty(row.get("State"))
-    zip_code = null_if_empty(row.get("Zip"))
-
     # -------- Contacts --------
-    contacts = parse_contacts(row.get("Contacts (Name/Email/Phone)"))
+    contacts = parse_contacts(cell_value(row, cols, "Contacts (Name/Email/Phone)"))
+
+    return {
+        "account": dict(
+            name=name,
+            code=code,
+            probability=probability,
+            account_partner=account_partner,
+            delivery_partner=delivery_partner,
+            **lookup_ids,
+        ),
+        "address": dict(
+            addressLine1=line1,
+            addressLine2=null_if_empty(cell_value(row, cols, "Address Line2")),
+            city=city,
+            state=null_if_empty(cell_value(row, cols, "State")),
+            countryCode=country,
+            zip=null_if_empty(cell_value(row, cols, "Zip")),
+        ),
+        "contacts": contacts,
+    }
+
+
+def prepare_next_batch(
+    batches: Iterator[Tuple[Tuple[int, Row], ...]],
+    cols: Dict[str, int],
+    maps: Dict[str, Dict[str, UUID]],
+):
+    """
+    Read and validate the next batch of file rows.
+
+    Returns a list of (row_number, values, error) with exactly one of
+    values / error set, or None once the file is exhausted.
+    """
+    batch = next(batches, None)
+    if batch is None:
+        return None
+
+    prepared = []
+    for idx, row in batch:
+        try:
+            prepared.append((idx, validate_import_row(row, cols, maps), None))
+        except Exception as e:
+            prepared.append((idx, None, e))
+    return prepared
+
+
+# -------------------------------------------------------
+# CREATE or UPDATE row
+# -------------------------------------------------------
+def process_import_row(
+    db: Session,
+    values: Dict[str, Any],
+    user_id: UUID,
+    existing: Dict[str, Account],
+):
+    """
+    Handles both:
+    - CREATE new account
+    - UPDATE existing account (matched by Code)
+
+    New Address / Contact rows are not added to the session; they are
+    returned as column dicts so the caller can bulk insert them per batch.
+    Returns (result, account_id, new_address, new_contacts).
+    """
+    fields = values["account"]
+    address = values["address"]
+    code = fields["code"]
+
+    # Does account already exist?
+    account = existing.get(code)
 
     # =====================================================
     # UPDATE EXISTING ACCOUNT
     # =====================================================
-    if is_update:
+    if account is not None:
         acc = account
 
-        acc.name = name
-        acc.probability = probability
-        acc.account_partner = account_partner
-        acc.delivery_partner = delivery_partner
-        acc.department_id = department_id
-        acc.unit_id = unit_id
-        acc.vertical_id = vertical_id
-        acc.location_id = location_id
-        acc.status_id = status_id
+        for key, value in fields.items():
+            setattr(acc, key, value)
         acc.updated_by = user_id
 
         # --- Update address ---
-        addr = db.query(Address).filter(Address.account_id == acc.id).first()
+        new_address = None
+        addr = acc.billing_address
         if addr:
-            addr.addressLine1 = line1
-            addr.addressLine2 = line2
-            addr.city = city
-            addr.state = state
-            addr.countryCode = country
-            addr.zip = zip_code
+            for key, value in address.items():
+                setattr(addr, key, value)
             addr.updated_by = user_id
+            if addr.is_deleted:
+                addr.is_deleted = False
+                addr.deleted_at = None
+                addr.deleted_by = None
         else:
             # create new if missing
-            db.add(Address(
-                account_id=acc.id,
-                addressLine1=line1,
-                addressLine2=line2,
-                city=city,
-                state=state,
-                countryCode=country,
-                zip=zip_code,
-                created_by=user_id,
-            ))
+            new_address = dict(account_id=acc.id, **address, created_by=user_id)
 
         # --- Replace contacts ---
         db.query(Contact).filter(Contact.account_id == acc.id).delete()
 
-        for c in contacts:
-            db.add(Contact(
-                account_id=acc.id,
-                name=c["name"],
-                email=c["email"],
-                phone=c["phone"],
-                created_by=user_id,
-            ))
+        new_contacts = [
+            dict(account_id=acc.id, **c, created_by=user_id) for c in values["contacts"]
+        ]
 
-        return "updated"
+        return "updated", acc.id, new_address, new_contacts
 
     # =====================================================
     # CREATE NEW ACCOUNT
     # =====================================================
-    acc = Account(
-        name=name,
-        code=code,
-        probability=probability,
-        account_partner=account_partner,
-        delivery_partner=delivery_partner,
-        department_id=department_id,
-        unit_id=unit_id,
-        vertical_id=vertical_id,
-        location_id=location_id,
-        status_id=status_id,
-        created_by=user_id,
-    )
+    acc = Account(**fields, created_by=user_id)
     db.add(acc)
+    # Flushed inside the row's SAVEPOINT so a constraint error fails this row only
     db.flush()
+    existing[code] = acc
 
     # --- Create Address ---
-    db.add(Address(
-        account_id=acc.id,
-        addressLine1=line1,
-        addressLine2=line2,
-        city=city,
-        state=state,
-        countryCode=country,
-        zip=zip_code,
-        created_by=user_id,
-    ))
+    new_address = dict(account_id=acc.id, **address, created_by=user_id)
 
     # --- Create Contacts ---
-    for c in contacts:
-        db.add(Contact(
-            account_id=acc.id,
-            name=c["name"],
-            email=c["email"],
-            phone=c["phone"],
-            created_by=user_id,
-        ))
+    new_contacts = [
+        dict(account_id=acc.id, **c, created_by=user_id) for c in values["contacts"]
+    ]
 
-    return "created"
+    return "created", acc.id, new_address, new_contacts
 
 
 # -------------------------------------------------------
-# IMPORT ENDPOINT
+# Bulk insert of a batch's new addresses / contacts
 # -------------------------------------------------------
-@router.post("/import")
-async def import_accounts(
-    file: UploadFile = File(...),
-    db: Session = Depends(get_db),
-    current_user_id: UUID = Depends(get_current_user_id),
+def flush_pending_inserts(
+    db: Session,
+    addresses: Dict[UUID, dict],
+    contacts: Dict[UUID, List[dict]],
 ):
+    """Write the batch's new rows as one multi-row INSERT per table, then reset."""
+    if addresses:
+        db.execute(insert(Address), list(addresses.values()))
 
-    filename = file.filename.lower()
-    content = await file.read()
+    contact_rows = [c for rows in contacts.values() for c in rows]
+    if contact_rows:
+        db.execute(insert(Contact), contact_rows)
 
-    if not content:
-        raise HTTPException(status_code=400, detail="File is empty")
+    addresses.clear()
+    contacts.clear()
 
-    rows = []
+
+# -------------------------------------------------------
+# Helper: run a whole import (blocking; called off the event loop)
+# -------------------------------------------------------
+def run_import(db: Session, filename: str, content: bytes, current_user_id: UUID) -> Dict[str, Any]:
+    """Parse an uploaded CSV/XLSX file and upsert its accounts."""
 
     # CSV
     if filename.endswith(".csv"):
-        decoded = content.decode("utf-8")
-        reader = csv.DictReader(io.StringIO(decoded))
-        for row in reader:
-            rows.append({(k or "").strip(): v for k, v in row.items()})
+        cols, rows = read_csv_rows(content)
 
     # XLSX
     elif filename.endswith(".xlsx"):
-        wb = load_workbook(io.BytesIO(content), read_only=True)
-        ws = wb.active
-        header_row = next(ws.iter_rows(min_row=1, max_row=1))
-        headers = [str(c.value).strip() if c.value else "" for c in header_row]
-
-        for r in ws.iter_rows(min_row=2):
-            row_dict = {}
-            for i, cell in enumerate(r):
-                key = headers[i] if i < len(headers) else ""
-                if key:
-                    row_dict[key] = cell.value
-            rows.append(row_dict)
+        cols, rows = read_xlsx_rows(content)
     else:
         raise HTTPException(status_code=400, detail="File must be CSV or XLSX")
 
-    if not rows:
-        raise HTTPException(status_code=400, detail="No data found in file")
-
     summary = {"processed": 0, "created": 0, "updated": 0, "failed": 0, "errors": []}
 
-    for idx, row in enumerate(rows, start=2):
-        try:
-            result = process_import_row(db, row, current_user_id)
+    # Keyed by account id: a later row for the same account replaces earlier values
+    pending_addresses: Dict[UUID, dict] = {}
+    pending_contacts: Dict[UUID, List[dict]] = {}
+
+    # Rows are parsed lazily and handled one batch at a time, so only a couple
+    # of IMPORT_BATCH_SIZE batches (and their accounts) are ever held in memory.
+    # A worker thread reads/validates the next batch while this thread, which
+    # owns the session, writes the current one.
+    batches = batched(enumerate(rows, start=2), IMPORT_BATCH_SIZE)
+    maps = load_lookup_maps(db)
+
+    with ThreadPoolExecutor(max_workers=1) as reader:
+        next_batch = reader.submit(prepare_next_batch, batches, cols, maps)
+
+        while (batch := next_batch.result()) is not None:
+            next_batch = reader.submit(prepare_next_batch, batches, cols, maps)
+
+            valid = [values for _, values, _ in batch if values is not None]
+            existing = load_existing_accounts(db, valid)
+
+            for idx, values, error in batch:
+                try:
+                    if error is not None:
+                        raise error
+                    # SAVEPOINT per row: a bad row only rolls back its own changes
+                    with db.begin_nested():
+                        result, account_id, new_address, new_contacts = process_import_row(
+                            db, values, current_user_id, existing
+                        )
+                    if new_address:
+                        pending_addresses[account_id] = new_address
+                    pending_contacts[account_id] = new_contacts
+                    summary["processed"] += 1
+                    summary[result] += 1
+                except Exception as e:
+                    # An account created by the failed row was discarded with it
+                    code = values["account"]["code"] if values else None
+                    if code in existing and inspect(existing[code]).transient:
+                        del existing[code]
+                    summary["failed"] += 1
+                    summary["errors"].append({"row": idx, "error": str(e)})
+
+            flush_pending_inserts(db, pending_addresses, pending_contacts)
             db.commit()
-            summary["processed"] += 1
-            summary[result] += 1
-        except Exception as e:
-            db.rollback()
-            summary["failed"] += 1
-            summary["errors"].append({"row": idx, "error": str(e)})
+
+    if not summary["processed"] and not summary["failed"]:
+        raise HTTPException(status_code=400, detail="No data found in file")
 
     return summary
+
+
+# -------------------------------------------------------
+# IMPORT ENDPOINT
+# -------------------------------------------------------
+@router.post("/import")
+async def import_accounts(
+    file: UploadFile = File(...),
+    db: Session = Depends(get_db),
+    current_user_id: UUID = Depends(get_current_user_id),
+):
+
+    filename = file.filename.lower()
+    content = await file.read()
+
+    if not content:
+        raise HTTPException(status_code=400, detail="File is empty")
+
+    # Parsing and the DB writes are blocking; keep them off the event loop
+    return await run_in_threadpool(run_import, db, filename, content, current_user_id)
+
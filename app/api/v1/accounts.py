@@ -1,9 +1,15 @@
-from typing import List
-from fastapi import APIRouter, Depends, HTTPException, status
-from sqlalchemy.orm import Session, selectinload
+from typing import Iterator, List
+from fastapi import APIRouter, Depends, HTTPException, Response, status
+from fastapi.responses import StreamingResponse
+from pydantic import TypeAdapter
+from sqlalchemy import select, update
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.orm import Session, joinedload, selectinload, raiseload
+from sqlalchemy.orm.attributes import set_committed_value
 from sqlalchemy.sql import func
 from uuid import UUID
 
+from app.api.deps import get_current_user_id
 from app.database import get_db
 
 # ACCOUNT MODELS
@@ -25,76 +31,112 @@ from app.models.lookup_models import (
 from app.schemas.account import AccountCreate, AccountUpdate, Account as AccountSchema
 
 
-# TEMPORARY USER (replace when auth is added)
-def get_current_user_id() -> UUID:
-    return UUID("00000000-0000-0000-0000-000000000001")
-
-
 router = APIRouter(
     prefix="/accounts",
     tags=["Accounts"],
 )
 
+# Built once; the list endpoint validates and encodes through it directly
+_ACCOUNT_LIST = TypeAdapter(List[AccountSchema])
+
+# Pages up to this size are encoded in one go; larger ones are streamed in
+# keyset batches of this many accounts
+ACCOUNT_LIST_BATCH_SIZE = 500
+
+
+# -----------------------------------------------------------
+# Helper: audit columns stamped on every soft-deleted row
+# -----------------------------------------------------------
+def soft_delete_values(user_id: UUID) -> dict:
+    return {
+        "is_deleted": True,
+        "updated_by": user_id,
+        "deleted_at": func.now(),
+        "deleted_by": user_id,
+    }
+
+
+# -----------------------------------------------------------
+# Helper: validate lookup FK ids in one round-trip
+# -----------------------------------------------------------
+LOOKUP_FKS = (
+    (Department, "department_id", "Department"),
+    (Unit, "unit_id", "Unit"),
+    (Vertical, "vertical_id", "Vertical"),
+    (Location, "location_id", "Location"),
+    (Status, "status_id", "Status"),
+)
+
+
+def validate_lookup_fks(db: Session, data) -> None:
+    """404 on the first given lookup id that is missing or deleted."""
+    checks = [
+        (label, value, select(model.id).where(model.id == value, model.is_deleted == False).exists())
+        for model, field, label in LOOKUP_FKS
+        if (value := getattr(data, field)) is not None
+    ]
+    if not checks:
+        return
+
+    found = db.execute(select(*(exists for _, _, exists in checks))).one()
+    for (label, value, _), ok in zip(checks, found):
+        if not ok:
+            raise HTTPException(status_code=404, detail=f"{label} with id '{value}' does not exist")
+
 
 # -----------------------------------------------------------
 # CREATE ACCOUNT
 # -----------------------------------------------------------
 @router.post("/", response_model=AccountSchema, status_code=status.HTTP_201_CREATED)
-async def create_account(
+def create_account(
     account_in: AccountCreate,
     db: Session = Depends(get_db),
     current_user_id: UUID = Depends(get_current_user_id)
 ):
 
-    # Prevent duplicate code
-    if db.query(Account).filter(Account.code == account_in.code, Account.is_deleted == False).first():
-        raise HTTPException(status_code=400, detail=f"Account code '{account_in.code}' already exists")
-
-    # Validate FK function
-    def validate_fk(model, value: UUID, field_name: str):
-        if value is None:
-            return
-        exists = db.query(model).filter(model.id == value, model.is_deleted == False).first()
-        if not exists:
-            raise HTTPException(
-                status_code=404,
-                detail=f"{field_name} with id '{value}' does not exist"
-            )
-
     # Validate all lookups
-    validate_fk(Department, account_in.department_id, "Department")
-    validate_fk(Unit, account_in.unit_id, "Unit")
-    validate_fk(Vertical, account_in.vertical_id, "Vertical")
-    validate_fk(Location, account_in.location_id, "Location")
-    validate_fk(Status, account_in.status_id, "Status")
+    validate_lookup_fks(db, account_in)
 
+    # Create account first. The insert is guarded by the unique code, so a
+    # duplicate comes back as no row instead of needing a separate pre-check.
+    fields = account_in.model_dump(exclude={'billing_address', 'contacts'}, exclude_none=True)
     try:
-        # Create account first
-        fields = account_in.model_dump(exclude={'billing_address', 'contacts'}, exclude_none=True)
-        db_account = Account(**fields, created_by=current_user_id)
-        db.add(db_account)
-        db.flush()
+        db_account = db.scalars(
+            pg_insert(Account)
+            .values(**fields, created_by=current_user_id)
+            .on_conflict_do_nothing(index_elements=["code"])
+            .returning(Account)
+        ).first()
+    except Exception as e:
+        db.rollback()
+        raise HTTPException(status_code=500, detail=f"Failed to create account: {str(e)}")
+
+    if db_account is None:
+        raise HTTPException(status_code=400, detail=f"Account code '{account_in.code}' already exists")
 
+    try:
         # Create address (one-to-one)
         address_data = account_in.billing_address.model_dump(exclude_none=True)
         db_address = Address(**address_data, account_id=db_account.id, created_by=current_user_id)
         db.add(db_address)
 
         # Create contacts (optional)
+        db_contacts = []
         if account_in.contacts:
             for c in account_in.contacts:
                 data = c.model_dump(exclude_none=True)
-                db.add(Contact(**data, account_id=db_account.id, created_by=current_user_id))
+                db_contacts.append(Contact(**data, account_id=db_account.id, created_by=current_user_id))
+            db.add_all(db_contacts)
 
         db.commit()
 
-        created = db.query(Account).options(
-            selectinload(Account.billing_address),
-            selectinload(Account.contacts),
-            selectinload(Account.projects)
-        ).filter(Account.id == db_account.id).first()
+        # Everything the response needs was just written; attach it instead
+        # of reading the account back.
+        set_committed_value(db_account, "billing_address", db_address)
+        set_committed_value(db_account, "contacts", db_contacts)
+        set_committed_value(db_account, "projects", [])
 
-        return created
+        return db_account
 
     except Exception as e:
         db.rollback()
@@ -105,31 +147,76 @@ async def create_account(
 # GET ALL ACCOUNTS
 # -----------------------------------------------------------
 @router.get("/", response_model=List[AccountSchema])
-async def get_all_accounts(
+def get_all_accounts(
     skip: int = 0,
     limit: int = 50,
     db: Session = Depends(get_db)
 ):
-    accounts = db.query(Account).options(
-        selectinload(Account.billing_address),
+    stmt = select(Account).options(
+        joinedload(Account.billing_address),
         selectinload(Account.contacts),
-        selectinload(Account.projects)
-    ).filter(Account.is_deleted == False).offset(skip).limit(limit).all()
+        selectinload(Account.projects),
+        # anything else the response walks would be a lazy SELECT per row
+        raiseload("*")
+    ).order_by(Account.id)
+
+    if limit > ACCOUNT_LIST_BATCH_SIZE:
+        return StreamingResponse(
+            iter_account_list_json(db, stmt, skip, limit),
+            media_type="application/json",
+        )
+
+    accounts = db.scalars(stmt.offset(skip).limit(limit)).all()
 
-    return accounts
+    # Validate and encode to JSON bytes in pydantic-core; returning a Response
+    # skips FastAPI's second validation pass and the stdlib json.dumps
+    return Response(
+        _ACCOUNT_LIST.dump_json(_ACCOUNT_LIST.validate_python(accounts, from_attributes=True)),
+        media_type="application/json",
+    )
+
+
+def iter_account_list_json(db: Session, stmt, skip: int, limit: int) -> Iterator[bytes]:
+    """Yield a JSON array of up to `limit` accounts, one keyset batch at a time.
+
+    Only one batch of accounts (and its relations) is held at once. An error
+    mid-stream truncates the body, since the 200 is already sent.
+    """
+    yield b"["
+    separator = b""
+    last_id = None
+    remaining = limit
+    while remaining > 0:
+        size = min(ACCOUNT_LIST_BATCH_SIZE, remaining)
+        if last_id is None:
+            batch_stmt = stmt.offset(skip).limit(size)
+        else:
+            batch_stmt = stmt.where(Account.id > last_id).limit(size)
+        batch = db.scalars(batch_stmt).all()
+        if batch:
+            # dump_json gives "[...]"; strip the brackets to splice batches
+            encoded = _ACCOUNT_LIST.dump_json(_ACCOUNT_LIST.validate_python(batch, from_attributes=True))
+            yield separator + encoded[1:-1]
+            separator = b","
+        if len(batch) < size:
+            break
+        remaining -= size
+        last_id = batch[-1].id
+    yield b"]"
 
 
 # -----------------------------------------------------------
 # GET ACCOUNT BY ID
 # -----------------------------------------------------------
 @router.get("/{account_id}", response_model=AccountSchema)
-async def get_account_by_id(account_id: UUID, db: Session = Depends(get_db)):
+def get_account_by_id(account_id: UUID, db: Session = Depends(get_db)):
 
     account = db.query(Account).options(
-        selectinload(Account.billing_address),
+        joinedload(Account.billing_address),
         selectinload(Account.contacts),
-        selectinload(Account.projects)
-    ).filter(Account.id == account_id, Account.is_deleted == False).first()
+        selectinload(Account.projects),
+        raiseload("*")
+    ).filter(Account.id == account_id).first()
 
     if not account:
         raise HTTPException(status_code=404, detail="Account not found")
@@ -141,7 +228,7 @@ async def get_account_by_id(account_id: UUID, db: Session = Depends(get_db)):
 # UPDATE ACCOUNT
 # -----------------------------------------------------------
 @router.put("/{account_id}", response_model=AccountSchema)
-async def update_account(
+def update_account(
     account_id: UUID,
     account_update: AccountUpdate,
     db: Session = Depends(get_db),
@@ -157,10 +244,12 @@ async def update_account(
     # ----------------------------------------
     # 1. Fetch Account
     # ----------------------------------------
-    db_account = db.query(Account).filter(
-        Account.id == account_id,
-        Account.is_deleted == False
-    ).first()
+    db_account = db.query(Account).options(
+        joinedload(Account.billing_address),
+        selectinload(Account.contacts),
+        selectinload(Account.projects),
+        raiseload("*")
+    ).filter(Account.id == account_id).first()
 
     if not db_account:
         raise HTTPException(status_code=404, detail="Account not found")
@@ -171,8 +260,7 @@ async def update_account(
     if account_update.code:
         exists = db.query(Account).filter(
             Account.code == account_update.code,
-            Account.id != account_id,
-            Account.is_deleted == False
+            Account.id != account_id
         ).first()
         if exists:
             raise HTTPException(status_code=400, detail=f"Account code '{account_update.code}' already exists")
@@ -180,18 +268,7 @@ async def update_account(
     # ----------------------------------------
     # 3. Validate FK IDs (if provided)
     # ----------------------------------------
-    def validate_fk(model, value: UUID, field_name: str):
-        if value is None:
-            return
-        exists = db.query(model).filter(model.id == value, model.is_deleted == False).first()
-        if not exists:
-            raise HTTPException(status_code=404, detail=f"{field_name} with id '{value}' does not exist")
-
-    validate_fk(Department, account_update.department_id, "Department")
-    validate_fk(Unit, account_update.unit_id, "Unit")
-    validate_fk(Vertical, account_update.vertical_id, "Vertical")
-    validate_fk(Location, account_update.location_id, "Location")
-    validate_fk(Status, account_update.status_id, "Status")
+    validate_lookup_fks(db, account_update)
 
     try:
         # ----------------------------------------
@@ -206,7 +283,6 @@ async def update_account(
                 setattr(db_account, key, value)
 
         db_account.updated_by = current_user_id
-        db_account.updated_at = func.now()
 
         # # ----------------------------------------
         # # 5. Update Billing Address
@@ -264,15 +340,10 @@ async def update_account(
         db.commit()
 
         # ----------------------------------------
-        # 8. Return updated account with relationships
+        # 8. Return updated account (relationships were loaded up front
+        #    and stay valid since commit no longer expires the session)
         # ----------------------------------------
-        updated = db.query(Account).options(
-            selectinload(Account.billing_address),
-            selectinload(Account.contacts),
-            selectinload(Account.projects)
-        ).filter(Account.id == account_id).first()
-
-        return updated
+        return db_account
 
     except Exception as e:
         db.rollback()
@@ -282,54 +353,43 @@ async def update_account(
 # SOFT DELETE ACCOUNT
 # -----------------------------------------------------------
 @router.delete("/{account_id}", status_code=status.HTTP_204_NO_CONTENT)
-async def soft_delete_account(
+def soft_delete_account(
     account_id: UUID,
     db: Session = Depends(get_db),
     current_user_id: UUID = Depends(get_current_user_id)
 ):
 
-    acct = db.query(Account).filter(
-        Account.id == account_id,
-        Account.is_deleted == False
-    ).first()
-
-    if not acct:
-        raise HTTPException(status_code=404, detail="Account not found")
+    values = soft_delete_values(current_user_id)
+
+    # Account and its cascade in one round-trip: each child UPDATE runs as a
+    # data-modifying CTE keyed off the id the account UPDATE returns, so an
+    # unknown / already deleted account touches nothing.
+    deleted_account = (
+        update(Account)
+        .where(Account.id == account_id, Account.is_deleted == False)
+        .values(**values)
+        .returning(Account.id)
+        .cte("deleted_account")
+    )
+    cascade = [
+        update(model)
+        .where(
+            model.account_id.in_(select(deleted_account.c.id)),
+            model.is_deleted == False
+        )
+        .values(**values)
+        .cte(f"deleted_{model.__tablename__}")
+        for model in (Address, Contact, Project)
+    ]
+    stmt = select(deleted_account.c.id).add_cte(*cascade)
 
     try:
-        acct.is_deleted = True
-        acct.deleted_at = func.now()
-        acct.deleted_by = current_user_id
-        acct.updated_at = func.now()
-        acct.updated_by = current_user_id
-
-        # cascade delete
-        db.query(Address).filter(Address.account_id == account_id).update({
-            Address.is_deleted: True,
-            Address.updated_at: func.now(),
-            Address.updated_by: current_user_id,
-            Address.deleted_at: func.now(),
-            Address.deleted_by: current_user_id
-        })
-
-        db.query(Contact).filter(Contact.account_id == account_id).update({
-            Contact.is_deleted: True,
-            Contact.updated_at: func.now(),
-            Contact.updated_by: current_user_id,
-            Contact.deleted_at: func.now(),
-            Contact.deleted_by: current_user_id
-        })
-
-        db.query(Project).filter(Project.account_id == account_id).update({
-            Project.is_deleted: True,
-            Project.updated_at: func.now(),
-            Project.updated_by: current_user_id,
-            Project.deleted_at: func.now(),
-            Project.deleted_by: current_user_id
-        })
-
+        deleted_id = db.execute(stmt).scalar()
         db.commit()
 
     except Exception as e:
         db.rollback()
         raise HTTPException(status_code=500, detail="Failed to soft delete account")
+
+    if deleted_id is None:
+        raise HTTPException(status_code=404, detail="Account not found")
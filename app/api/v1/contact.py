@@ -1,18 +1,17 @@
-from typing import List
-from fastapi import APIRouter, Depends, HTTPException, status
-from sqlalchemy.orm import Session
+from typing import List, Optional
+from fastapi import APIRouter, Depends, HTTPException, Query, status
+from sqlalchemy import bindparam, insert, literal, select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import raiseload
 from sqlalchemy.sql import func
 from uuid import UUID
 
-from app.database import get_db
+from app.api.deps import get_current_user_id
+from app.database import get_async_db
 from app.models.contact import Contact
 from app.models.account import Account
 from app.schemas.contact import ContactCreate, ContactUpdate, ContactOut
-
-
-# --- TEMPORARY USER UNTIL AUTH IS ADDED ---
-def get_current_user_id() -> UUID:
-    return UUID("00000000-0000-0000-0000-000000000001")
+from app.schemas.pagination import Page
 
 
 router = APIRouter(
@@ -21,55 +20,125 @@ router = APIRouter(
 )
 
 
+# Hot single-row lookups, built once at import with bind params so requests
+# skip rebuilding the statement and go straight to the compiled-SQL cache
+_GET_CONTACT_BY_ID = select(Contact).options(raiseload("*")).where(
+    Contact.id == bindparam("contact_id")
+)
+_LIVE_ACCOUNT_ID = select(Account.id).where(
+    Account.id == bindparam("account_id")
+)
+
+
 # ------------------------------------------------------
 # 1. CREATE CONTACT
 # ------------------------------------------------------
 @router.post("/", response_model=ContactOut, status_code=status.HTTP_201_CREATED)
 async def create_contact(
     payload: ContactCreate,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
     current_user_id: UUID = Depends(get_current_user_id),
 ):
     """Create a new contact for an account."""
 
-    # Validate account exists
-    account = (
-        db.query(Account)
-        .filter(Account.id == payload.account_id, Account.is_deleted == False)
-        .first()
-    )
-    if not account:
+    # INSERT ... SELECT from the live account row: the account check and the
+    # insert are one statement, and no row back means the account is missing
+    fields = {
+        "name": payload.name,
+        "email": payload.email,
+        "phone": payload.phone,
+        "created_by": current_user_id,
+    }
+    source = select(
+        *(literal(value, Contact.__table__.c[key].type) for key, value in fields.items()),
+        Account.id,
+    ).where(Account.id == payload.account_id, Account.is_deleted == False)
+
+    try:
+        new_contact = await db.scalar(
+            insert(Contact)
+            .from_select([*fields, "account_id"], source)
+            .returning(Contact)
+        )
+        await db.commit()
+
+    except Exception as e:
+        await db.rollback()
+        raise HTTPException(status_code=500, detail=f"Failed to create contact: {str(e)}")
+
+    if new_contact is None:
         raise HTTPException(
             status_code=404,
             detail=f"Account {payload.account_id} does not exist",
         )
 
-    try:
-        new_contact = Contact(
-            name=payload.name,
-            email=payload.email,
-            phone=payload.phone,
-            account_id=payload.account_id,
-            created_by=current_user_id,
+    return new_contact
+
+
+# ------------------------------------------------------
+# 1b. BULK CREATE CONTACTS
+# ------------------------------------------------------
+@router.post("/bulk", response_model=List[ContactOut], status_code=status.HTTP_201_CREATED)
+async def create_contacts_bulk(
+    payload: List[ContactCreate],
+    db: AsyncSession = Depends(get_async_db),
+    current_user_id: UUID = Depends(get_current_user_id),
+):
+    """Create many contacts with a single INSERT. Every account must exist."""
+    if not payload:
+        return []
+
+    # Validate all accounts with one query
+    account_ids = {c.account_id for c in payload}
+    found = set(
+        await db.scalars(
+            select(Account.id).where(Account.id.in_(account_ids))
+        )
+    )
+    missing = account_ids - found
+    if missing:
+        raise HTTPException(
+            status_code=404,
+            detail=f"Account(s) {', '.join(sorted(str(i) for i in missing))} do not exist",
         )
 
-        db.add(new_contact)
-        db.commit()
-        db.refresh(new_contact)
-        return new_contact
+    try:
+        contacts = (await db.scalars(
+            insert(Contact)
+            .values([c.model_dump() | {"created_by": current_user_id} for c in payload])
+            .returning(Contact)
+        )).all()
+        await db.commit()
+        return contacts
 
     except Exception as e:
-        db.rollback()
-        raise HTTPException(status_code=500, detail=f"Failed to create contact: {str(e)}")
+        await db.rollback()
+        raise HTTPException(status_code=500, detail=f"Failed to create contacts: {str(e)}")
 
 
 # ------------------------------------------------------
 # 2. GET ALL CONTACTS (ACTIVE ONLY)
 # ------------------------------------------------------
-@router.get("/", response_model=List[ContactOut])
-async def get_all_contacts(db: Session = Depends(get_db)):
-    """Fetch all active (not deleted) contacts."""
-    return db.query(Contact).filter(Contact.is_deleted == False).all()
+@router.get("/", response_model=Page[ContactOut])
+async def get_all_contacts(
+    cursor: Optional[UUID] = None,
+    limit: int = Query(100, ge=1, le=1000),
+    email: Optional[str] = None,
+    db: AsyncSession = Depends(get_async_db),
+):
+    """Fetch a page of active (not deleted) contacts, ordered by id.
+    Optionally filter by email (case-insensitive)."""
+    # ContactOut carries account_id only; never load the Account
+    query = select(Contact).options(raiseload("*"))
+    if email:
+        # Matches the lower(email) expression index
+        query = query.where(func.lower(Contact.email) == email.lower())
+    if cursor:
+        query = query.where(Contact.id > cursor)
+
+    items = (await db.scalars(query.order_by(Contact.id).limit(limit))).all()
+    next_cursor = items[-1].id if len(items) == limit else None
+    return {"items": items, "next_cursor": next_cursor}
 
 
 # ------------------------------------------------------
@@ -78,15 +147,11 @@ async def get_all_contacts(db: Session = Depends(get_db)):
 @router.get("/{contact_id}", response_model=ContactOut)
 async def get_contact_by_id(
     contact_id: UUID,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
 ):
     """Retrieve a contact by its ID."""
 
-    contact = (
-        db.query(Contact)
-        .filter(Contact.id == contact_id, Contact.is_deleted == False)
-        .first()
-    )
+    contact = await db.scalar(_GET_CONTACT_BY_ID, {"contact_id": contact_id})
 
     if not contact:
         raise HTTPException(
@@ -104,60 +169,49 @@ async def get_contact_by_id(
 async def update_contact(
     contact_id: UUID,
     payload: ContactUpdate,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
     current_user_id: UUID = Depends(get_current_user_id),
 ):
     """Update a contact."""
 
-    contact = (
-        db.query(Contact)
-        .filter(Contact.id == contact_id, Contact.is_deleted == False)
-        .first()
-    )
-
-    if not contact:
-        raise HTTPException(
-            status_code=404,
-            detail=f"Contact with id {contact_id} not found",
-        )
-
     # Update only provided fields
-    if payload.name:
-        contact.name = payload.name
-
-    if payload.email:
-        contact.email = payload.email
-
-    if payload.phone:
-        contact.phone = payload.phone
+    values = {
+        field: value
+        for field, value in payload.model_dump(exclude_unset=True).items()
+        if value
+    }
 
     # Optional: Allow moving contact between accounts
-    if payload.account_id and payload.account_id != contact.account_id:
+    if "account_id" in values:
         # Check new account exists
-        account = (
-            db.query(Account)
-            .filter(Account.id == payload.account_id, Account.is_deleted == False)
-            .first()
-        )
+        account = await db.scalar(_LIVE_ACCOUNT_ID, {"account_id": values["account_id"]})
         if not account:
             raise HTTPException(
                 status_code=404,
-                detail=f"Target account {payload.account_id} does not exist",
+                detail=f"Target account {values['account_id']} does not exist",
             )
-        contact.account_id = payload.account_id
 
     try:
-        contact.updated_by = current_user_id
-        contact.updated_at = func.now()
-
-        db.commit()
-        db.refresh(contact)
-        return contact
+        contact = await db.scalar(
+            update(Contact)
+            .where(Contact.id == contact_id, Contact.is_deleted == False)
+            .values(**values, updated_by=current_user_id)
+            .returning(Contact)
+        )
+        await db.commit()
 
     except Exception as e:
-        db.rollback()
+        await db.rollback()
         raise HTTPException(status_code=500, detail=f"Failed to update contact: {str(e)}")
 
+    if contact is None:
+        raise HTTPException(
+            status_code=404,
+            detail=f"Contact with id {contact_id} not found",
+        )
+
+    return contact
+
 
 # ------------------------------------------------------
 # 5. SOFT DELETE CONTACT
@@ -165,35 +219,29 @@ async def update_contact(
 @router.delete("/{contact_id}", status_code=status.HTTP_204_NO_CONTENT)
 async def delete_contact(
     contact_id: UUID,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
     current_user_id: UUID = Depends(get_current_user_id),
 ):
     """Soft delete a contact."""
 
-    contact = (
-        db.query(Contact)
-        .filter(Contact.id == contact_id, Contact.is_deleted == False)
-        .first()
-    )
-
-    if not contact:
-        raise HTTPException(
-            status_code=404,
-            detail=f"Contact with id {contact_id} not found or already deleted",
-        )
-
     try:
-        contact.is_deleted = True
-        contact.deleted_at = func.now()
-        contact.deleted_by = current_user_id
-
-        db.commit()
-        return
+        deleted_id = await db.scalar(
+            update(Contact)
+            .where(Contact.id == contact_id, Contact.is_deleted == False)
+            .values(is_deleted=True, deleted_at=func.now(), deleted_by=current_user_id)
+            .returning(Contact.id)
+        )
+        await db.commit()
 
     except Exception as e:
-        db.rollback()
+        await db.rollback()
         raise HTTPException(status_code=500, detail=f"Failed to delete contact: {str(e)}")
 
+    if deleted_id is None:
+        raise HTTPException(
+            status_code=404,
+            detail=f"Contact with id {contact_id} not found or already deleted",
+        )
 
 
 # You cannot create a contact without an account.
@@ -202,4 +250,5 @@ async def delete_contact(
 
 # You can delete a contact independently — it won’t delete the account.
 
-# When an account is soft-deleted → all its contacts are also soft deleted.
\ No newline at end of file
+# When an account is soft-deleted → all its contacts are also soft deleted.
+#   (set-based, in the same statement as the account: see soft_delete_account)
\ No newline at end of file
@@ -0,0 +1,224 @@
+from typing import List, Optional
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response, status
+from sqlalchemy import bindparam, select, text, update
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.sql import func
+from uuid import UUID
+
+from app.core.cache import cached, invalidate
+from app.api.deps import body_etag, conditional_response, get_current_user_id, lookup_version
+from app.database import Base, get_async_db
+from app.schemas.lookup_base import LookupCreate, LookupUpdate, Lookup as LookupSchema
+from app.schemas.pagination import Page
+
+
+def make_lookup_router(model: type[Base], name: str) -> APIRouter:
+    """
+    Build the CRUD router for a name-only lookup table (departments, units, ...).
+
+    `name` is the singular used in messages ("unit", "status"); the route
+    prefix, tag and cache namespace come from the model's table name.
+    """
+    namespace = model.__tablename__
+    label = name.capitalize()
+
+    router = APIRouter(
+        prefix=f"/{namespace}",
+        tags=[namespace.capitalize()],
+    )
+
+    # Built once per lookup; each request only supplies the bind value
+    get_by_id = select(model).where(model.id == bindparam("item_id"))
+
+    # Names are unique among live rows through a partial index; inserts use it
+    # as the ON CONFLICT target
+    on_live_name = dict(index_elements=["name"], index_where=text("is_deleted = false"))
+
+    # ---------------------------
+    # 1. CREATE
+    # ---------------------------
+    @router.post("/", response_model=LookupSchema, status_code=status.HTTP_201_CREATED)
+    async def create_item(
+        item_in: LookupCreate,
+        db: AsyncSession = Depends(get_async_db),
+        current_user_id: UUID = Depends(get_current_user_id),
+    ):
+        """Create a new lookup value; 400 if the name is already active."""
+        try:
+            db_item = await db.scalar(
+                pg_insert(model)
+                .values(name=item_in.name, created_by=current_user_id)
+                .on_conflict_do_nothing(**on_live_name)
+                .returning(model)
+            )
+            await db.commit()
+            invalidate(namespace)
+
+        except Exception as e:
+            await db.rollback()
+            raise HTTPException(status_code=500, detail=f"Failed to create {name}: {str(e)}")
+
+        if db_item is None:
+            raise HTTPException(status_code=400, detail=f"{label} '{item_in.name}' already exists")
+
+        return db_item
+
+    # ---------------------------
+    # 1b. BULK CREATE
+    # ---------------------------
+    @router.post("/bulk", response_model=List[LookupSchema], status_code=status.HTTP_201_CREATED)
+    async def create_items_bulk(
+        items_in: List[LookupCreate],
+        db: AsyncSession = Depends(get_async_db),
+        current_user_id: UUID = Depends(get_current_user_id),
+    ):
+        """Create many values with a single INSERT; names already active are skipped."""
+        if not items_in:
+            return []
+
+        try:
+            created = (await db.scalars(
+                pg_insert(model)
+                .values([{"name": item.name, "created_by": current_user_id} for item in items_in])
+                .on_conflict_do_nothing(**on_live_name)
+                .returning(model)
+            )).all()
+            await db.commit()
+            invalidate(namespace)
+            return created
+
+        except Exception as e:
+            await db.rollback()
+            raise HTTPException(status_code=500, detail=f"Failed to create {namespace}: {str(e)}")
+
+    # ---------------------------
+    # 2. GET ALL
+    # ---------------------------
+    # Cached as (etag, body) pairs keyed on the table version: a write on
+    # another worker changes the version and retires the old pair, and a 304
+    # is only ever sent for the ETag of the body a 200 would carry now
+    @cached(namespace)
+    async def load_page(cursor, limit, version, db):
+        query = select(model)
+        if cursor:
+            query = query.where(model.id > cursor)
+
+        items = (await db.scalars(query.order_by(model.id).limit(limit))).all()
+        next_cursor = items[-1].id if len(items) == limit else None
+        # Cache validated schemas, not ORM rows: a hit is then serialization only
+        page = Page[LookupSchema](
+            items=[LookupSchema.model_validate(item) for item in items],
+            next_cursor=next_cursor,
+        )
+        return body_etag(page), page
+
+    @cached(namespace)
+    async def load_item(item_id, version, db):
+        db_item = await db.scalar(get_by_id, {"item_id": item_id})
+        if not db_item:
+            return None, None
+        item = LookupSchema.model_validate(db_item)
+        return body_etag(item), item
+
+    @router.get("/", response_model=Page[LookupSchema])
+    async def get_all_items(
+        request: Request,
+        response: Response,
+        cursor: Optional[UUID] = None,
+        limit: int = Query(100, ge=1, le=1000),
+        version: str = Depends(lookup_version(namespace, model)),
+        db: AsyncSession = Depends(get_async_db),
+    ):
+        """Get a page of active values ordered by id (pass next_cursor back as ?cursor)."""
+        etag, page = await load_page(cursor, limit, version, db=db)
+        return conditional_response(request, response, etag, page)
+
+    # ---------------------------
+    # 3. GET BY ID
+    # ---------------------------
+    @router.get("/{item_id}", response_model=LookupSchema)
+    async def get_item_by_id(
+        request: Request,
+        response: Response,
+        item_id: UUID,
+        version: str = Depends(lookup_version(namespace, model)),
+        db: AsyncSession = Depends(get_async_db),
+    ):
+        """Retrieve a single active value."""
+        etag, item = await load_item(item_id, version, db=db)
+
+        if item is None:
+            raise HTTPException(status_code=404, detail=f"{label} with id '{item_id}' not found")
+
+        return conditional_response(request, response, etag, item)
+
+    # ---------------------------
+    # 4. UPDATE
+    # ---------------------------
+    @router.put("/{item_id}", response_model=LookupSchema)
+    async def update_item(
+        item_id: UUID,
+        item_update: LookupUpdate,
+        db: AsyncSession = Depends(get_async_db),
+        current_user_id: UUID = Depends(get_current_user_id),
+    ):
+        """Rename a value."""
+        values = {"name": item_update.name} if item_update.name else {}
+
+        try:
+            # One statement: the WHERE is the existence check, and the live-name
+            # unique index rejects a rename to a name that is already active
+            db_item = await db.scalar(
+                update(model)
+                .where(model.id == item_id, model.is_deleted == False)
+                .values(**values, updated_by=current_user_id)
+                .returning(model)
+            )
+            await db.commit()
+            invalidate(namespace)
+
+        except IntegrityError:
+            await db.rollback()
+            raise HTTPException(status_code=400, detail=f"{label} '{item_update.name}' already exists")
+        except Exception as e:
+            await db.rollback()
+            raise HTTPException(status_code=500, detail=f"Failed to update {name}: {str(e)}")
+
+        if db_item is None:
+            raise HTTPException(status_code=404, detail=f"{label} with id '{item_id}' not found")
+
+        return db_item
+
+    # ---------------------------
+    # 5. SOFT DELETE
+    # ---------------------------
+    @router.delete("/{item_id}", status_code=status.HTTP_204_NO_CONTENT)
+    async def delete_item(
+        item_id: UUID,
+        db: AsyncSession = Depends(get_async_db),
+        current_user_id: UUID = Depends(get_current_user_id),
+    ):
+        """Soft delete (mark as deleted) a value."""
+        try:
+            deleted_id = await db.scalar(
+                update(model)
+                .where(model.id == item_id, model.is_deleted == False)
+                .values(is_deleted=True, deleted_by=current_user_id, deleted_at=func.now())
+                .returning(model.id)
+            )
+            await db.commit()
+            invalidate(namespace)
+
+        except Exception as e:
+            await db.rollback()
+            raise HTTPException(status_code=500, detail=f"Failed to delete {name}: {str(e)}")
+
+        if deleted_id is None:
+            raise HTTPException(
+                status_code=404,
+                detail=f"{label} with id '{item_id}' not found or already deleted",
+            )
+
+    return router
@@ -1,102 +1,156 @@
-from typing import List
-from fastapi import APIRouter, Depends, HTTPException, status
-from sqlalchemy.orm import Session, selectinload
+from typing import List, Optional
+from fastapi import APIRouter, Depends, HTTPException, Query, status
+from sqlalchemy import bindparam, literal, select, text, update
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import raiseload
 from sqlalchemy.sql import func
 from uuid import UUID
 
-from app.database import get_db
+from app.api.deps import get_current_user_id
+from app.database import get_async_db
 from app.models.project import Project
 from app.models.account import Account
 from app.schemas.project import ProjectCreate, ProjectUpdate, Project as ProjectSchema
-
-# --- TEMP DEPENDENCY (replace with real auth later) ---
-def get_current_user_id() -> UUID:
-    return UUID("00000000-0000-0000-0000-000000000001")
+from app.schemas.pagination import Page
 
 
 router = APIRouter(prefix="/projects", tags=["Projects"])
 
 
+# Prebuilt statements for the per-request lookups; callers pass bind values
+_GET_PROJECT_BY_ID = select(Project).options(raiseload("*")).where(
+    Project.id == bindparam("project_id")
+)
+_LIVE_ACCOUNT_ID = select(Account.id).where(
+    Account.id == bindparam("account_id")
+)
+
+
 # ---------------------------
 # 1. CREATE A PROJECT
 # ---------------------------
 @router.post("/", response_model=ProjectSchema, status_code=status.HTTP_201_CREATED)
 async def create_project(
     project_in: ProjectCreate,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
     current_user_id: UUID = Depends(get_current_user_id),
 ):
     """
     Create a project. Requires a valid account_id (project must belong to an account).
     Validates project_code uniqueness if provided.
-    Returns the created project with the related account loaded.
     """
-    # Validate account existence (business rule: project must have an account)
-    account = db.query(Account).filter(Account.id == project_in.account_id, Account.is_deleted == False).first()
-    if not account:
-        raise HTTPException(status_code=400, detail="account_id is invalid or the account is deleted")
-
-    # Optional: validate unique project_code if provided
-    if project_in.project_code:
-        duplicate = db.query(Project).filter(
-            Project.project_code == project_in.project_code,
-            Project.is_deleted == False
-        ).first()
-        if duplicate:
-            raise HTTPException(status_code=400, detail=f"Project code '{project_in.project_code}' already exists")
+    project_fields = project_in.model_dump(exclude_none=True, exclude={"account_id"})
+    project_fields["created_by"] = current_user_id
+
+    # INSERT ... SELECT from the live account row (business rule: project must
+    # have an account), guarded by the live project_code unique index
+    source = select(
+        *(literal(value, Project.__table__.c[key].type) for key, value in project_fields.items()),
+        Account.id,
+    ).where(Account.id == project_in.account_id, Account.is_deleted == False)
 
     try:
-        project_fields = project_in.model_dump(exclude_none=True)
-        db_project = Project(**project_fields, created_by=current_user_id)
-        db.add(db_project)
+        db_project = await db.scalar(
+            pg_insert(Project)
+            .from_select([*project_fields, "account_id"], source)
+            .on_conflict_do_nothing(
+                index_elements=["project_code"],
+                index_where=text("is_deleted = false AND project_code IS NOT NULL"),
+            )
+            .returning(Project)
+        )
+        await db.commit()
+
+    except Exception as e:
+        await db.rollback()
+        raise HTTPException(status_code=500, detail=f"Failed to create project: {str(e)}")
 
-        # Flush to populate DB defaults / get PK, though we will refresh after commit
-        db.flush()
-        db.commit()
-        db.refresh(db_project)
+    if db_project is None:
+        # Nothing inserted: missing account or a duplicate code; only this
+        # failure path pays for the extra lookup
+        account = await db.scalar(_LIVE_ACCOUNT_ID, {"account_id": project_in.account_id})
+        if not account:
+            raise HTTPException(status_code=400, detail="account_id is invalid or the account is deleted")
+        raise HTTPException(status_code=400, detail=f"Project code '{project_in.project_code}' already exists")
 
-        # Return the project with related account loaded (avoid N+1 on clients)
-        project_with_account = db.query(Project).options(
-            selectinload(Project.account)
-        ).filter(Project.id == db_project.id).first()
+    return db_project
 
-        return project_with_account
+
+# ---------------------------
+# 1b. BULK CREATE PROJECTS
+# ---------------------------
+@router.post("/bulk", response_model=List[ProjectSchema], status_code=status.HTTP_201_CREATED)
+async def create_projects_bulk(
+    projects_in: List[ProjectCreate],
+    db: AsyncSession = Depends(get_async_db),
+    current_user_id: UUID = Depends(get_current_user_id),
+):
+    """
+    Create many projects with one account check and a single INSERT.
+    Projects whose project_code is already active are skipped.
+    """
+    if not projects_in:
+        return []
+
+    # Validate all referenced accounts in one query
+    account_ids = {p.account_id for p in projects_in}
+    found = set(await db.scalars(select(Account.id).where(Account.id.in_(account_ids))))
+    missing = account_ids - found
+    if missing:
+        raise HTTPException(status_code=400, detail=f"account_id(s) invalid or deleted: {', '.join(sorted(str(i) for i in missing))}")
+
+    try:
+        created = (await db.scalars(
+            pg_insert(Project)
+            .values([p.model_dump() | {"created_by": current_user_id} for p in projects_in])
+            .on_conflict_do_nothing(
+                index_elements=["project_code"],
+                index_where=text("is_deleted = false AND project_code IS NOT NULL"),
+            )
+            .returning(Project)
+        )).all()
+        await db.commit()
+        return created
 
     except Exception as e:
-        db.rollback()
-        print(f"Error creating project: {e}")
-        raise HTTPException(status_code=500, detail=f"Failed to create project: {str(e)}")
+        await db.rollback()
+        raise HTTPException(status_code=500, detail=f"Failed to create projects: {str(e)}")
 
 
 # ---------------------------
 # 2. GET ALL PROJECTS
 # ---------------------------
-@router.get("/", response_model=List[ProjectSchema])
+@router.get("/", response_model=Page[ProjectSchema])
 async def get_all_projects(
-    skip: int = 0,
-    limit: int = 100,
-    db: Session = Depends(get_db),
+    cursor: Optional[UUID] = None,
+    limit: int = Query(100, ge=1, le=1000),
+    db: AsyncSession = Depends(get_async_db),
 ):
     """
-    Retrieve a paginated list of active projects. Loads the related Account to avoid N+1.
+    Retrieve a keyset-paginated list of active projects (ordered by id; pass
+    next_cursor back as ?cursor). The response carries account_id only, so the
+    related Account is not loaded; raiseload keeps it that way.
     """
-    projects = db.query(Project).options(
-        selectinload(Project.account)
-    ).filter(Project.is_deleted == False).offset(skip).limit(limit).all()
-    return projects
+    query = select(Project).options(raiseload("*"))
+    if cursor:
+        query = query.where(Project.id > cursor)
+
+    projects = (await db.scalars(query.order_by(Project.id).limit(limit))).all()
+    next_cursor = projects[-1].id if len(projects) == limit else None
+    return {"items": projects, "next_cursor": next_cursor}
 
 
 # ---------------------------
 # 3. GET A SINGLE PROJECT BY ID
 # ---------------------------
 @router.get("/{project_id}", response_model=ProjectSchema)
-async def get_project_by_id(project_id: UUID, db: Session = Depends(get_db)):
+async def get_project_by_id(project_id: UUID, db: AsyncSession = Depends(get_async_db)):
     """
-    Retrieve a single project (with its account).
+    Retrieve a single project.
     """
-    db_project = db.query(Project).options(
-        selectinload(Project.account)
-    ).filter(Project.id == project_id, Project.is_deleted == False).first()
+    db_project = await db.scalar(_GET_PROJECT_BY_ID, {"project_id": project_id})
 
     if not db_project:
         raise HTTPException(status_code=404, detail=f"Project with ID {project_id} not found")
@@ -111,60 +165,48 @@ async def get_project_by_id(project_id: UUID, db: Session = Depends(get_db)):
 async def update_project_details(
     project_id: UUID,
     project_update: ProjectUpdate,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
     current_user_id: UUID = Depends(get_current_user_id),
 ):
     """
     Update mutable fields of an existing project.
     Validates new account_id if provided and uniqueness of project_code if changed.
-    Returns the updated project with the related account loaded.
+    Returns the updated project.
     """
-    db_project = db.query(Project).filter(Project.id == project_id, Project.is_deleted == False).first()
-    if not db_project:
-        raise HTTPException(status_code=404, detail=f"Project with ID {project_id} not found")
-
-    # If client attempts to change project_code, validate uniqueness
     update_data = project_update.model_dump(exclude_unset=True)
 
-    if "project_code" in update_data and update_data["project_code"] != db_project.project_code:
-        if update_data["project_code"]:
-            dup = db.query(Project).filter(
-                Project.project_code == update_data["project_code"],
-                Project.id != project_id,
-                Project.is_deleted == False
-            ).first()
-            if dup:
-                raise HTTPException(status_code=400, detail=f"Project code '{update_data['project_code']}' already exists")
-
     # If account_id is present in update, validate it
     if "account_id" in update_data:
         new_account_id = update_data["account_id"]
         if new_account_id is None:
             raise HTTPException(status_code=400, detail="account_id cannot be null")
-        acct = db.query(Account).filter(Account.id == new_account_id, Account.is_deleted == False).first()
+        acct = await db.scalar(_LIVE_ACCOUNT_ID, {"account_id": new_account_id})
         if not acct:
             raise HTTPException(status_code=400, detail="Provided account_id is invalid or deleted")
 
     try:
-        # Apply updates
-        for key, value in update_data.items():
-            if hasattr(db_project, key):
-                setattr(db_project, key, value)
-
-        db_project.updated_by = current_user_id
-        db_project.updated_at = func.now()
-
-        db.commit()
-        db.refresh(db_project)
-
-        updated = db.query(Project).options(selectinload(Project.account)).filter(Project.id == project_id).first()
-        return updated
-
+        # Single UPDATE ... RETURNING; a clash on project_code is rejected by
+        # the live-code unique index instead of a separate lookup
+        db_project = await db.scalar(
+            update(Project)
+            .where(Project.id == project_id, Project.is_deleted == False)
+            .values(**update_data, updated_by=current_user_id)
+            .returning(Project)
+        )
+        await db.commit()
+
+    except IntegrityError:
+        await db.rollback()
+        raise HTTPException(status_code=400, detail=f"Project code '{update_data.get('project_code')}' already exists")
     except Exception as e:
-        db.rollback()
-        print(f"Error updating project: {e}")
+        await db.rollback()
         raise HTTPException(status_code=500, detail=f"Failed to update project: {str(e)}")
 
+    if db_project is None:
+        raise HTTPException(status_code=404, detail=f"Project with ID {project_id} not found")
+
+    return db_project
+
 
 # ---------------------------
 # 5. SOFT DELETE A PROJECT
@@ -172,29 +214,30 @@ async def update_project_details(
 @router.delete("/{project_id}", status_code=status.HTTP_204_NO_CONTENT)
 async def soft_delete_project(
     project_id: UUID,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
     current_user_id: UUID = Depends(get_current_user_id),
 ):
     """
     Soft-delete a project (set is_deleted + deleted_at + deleted_by).
-    Also updates updated_at and updated_by.
+    Also updates updated_by (updated_at is stamped by the model).
     """
-    db_project = db.query(Project).filter(Project.id == project_id, Project.is_deleted == False).first()
-    if not db_project:
-        raise HTTPException(status_code=404, detail="Project not found or already deleted")
-
     try:
-        db_project.is_deleted = True
-        db_project.updated_at = func.now()
-        db_project.updated_by = current_user_id
-        db_project.deleted_at = func.now()
-        db_project.deleted_by = current_user_id
-
-        db.add(db_project)
-        db.commit()
-        return
+        deleted_id = await db.scalar(
+            update(Project)
+            .where(Project.id == project_id, Project.is_deleted == False)
+            .values(
+                is_deleted=True,
+                updated_by=current_user_id,
+                deleted_at=func.now(),
+                deleted_by=current_user_id,
+            )
+            .returning(Project.id)
+        )
+        await db.commit()
 
     except Exception as e:
-        db.rollback()
-        print(f"Error soft deleting project: {e}")
+        await db.rollback()
         raise HTTPException(status_code=500, detail=f"Failed to soft delete project: {str(e)}")
+
+    if deleted_id is None:
+        raise HTTPException(status_code=404, detail="Project not found or already deleted")
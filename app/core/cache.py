@@ -0,0 +1,101 @@
+# app/core/cache.py
+import inspect
+from functools import wraps
+from threading import Lock
+
+from cachetools import TTLCache
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+
+from app.core.config import cfg
+
+# Lookup tables change rarely but are read on most page loads. Entries live
+# per process, so another worker may serve a stale list for up to the TTL.
+CACHE_TTL = cfg.lookup_cache_ttl
+CACHE_MAX_ENTRIES = 1024
+# Table version tokens that key the cached lookup bodies; kept short so writes
+# made on another worker show up quickly.
+VERSION_TTL = cfg.lookup_etag_ttl
+
+_caches = {}
+_versions = TTLCache(maxsize=CACHE_MAX_ENTRIES, ttl=VERSION_TTL)
+_generations = {}
+_lock = Lock()
+
+
+def _cache_for(namespace: str) -> TTLCache:
+    if namespace not in _caches:
+        _caches[namespace] = TTLCache(maxsize=CACHE_MAX_ENTRIES, ttl=CACHE_TTL)
+        _generations[namespace] = 0
+    return _caches[namespace]
+
+
+def _key(func, args, kwargs) -> tuple:
+    return (func.__name__, args) + tuple(
+        sorted((k, v) for k, v in kwargs.items() if not isinstance(v, (Session, AsyncSession)))
+    )
+
+
+def _lookup(namespace: str, key: tuple):
+    """Return (hit, value, generation) for a key."""
+    with _lock:
+        cache = _cache_for(namespace)
+        if key in cache:
+            return True, cache[key], None
+        return False, None, _generations[namespace]
+
+
+def _store(namespace: str, key: tuple, generation: int, value) -> None:
+    # Skip storing if a write invalidated the namespace meanwhile
+    with _lock:
+        if _generations[namespace] == generation:
+            _caches[namespace][key] = value
+
+
+def cached(namespace: str):
+    """Cache a GET endpoint's result (sync or async), keyed on its non-session arguments."""
+    def decorator(func):
+        if inspect.iscoroutinefunction(func):
+            @wraps(func)
+            async def async_wrapper(*args, **kwargs):
+                key = _key(func, args, kwargs)
+                hit, value, generation = _lookup(namespace, key)
+                if hit:
+                    return value
+                result = await func(*args, **kwargs)
+                _store(namespace, key, generation, result)
+                return result
+            return async_wrapper
+
+        @wraps(func)
+        def wrapper(*args, **kwargs):
+            key = _key(func, args, kwargs)
+            hit, value, generation = _lookup(namespace, key)
+            if hit:
+                return value
+            result = func(*args, **kwargs)
+            _store(namespace, key, generation, result)
+            return result
+        return wrapper
+    return decorator
+
+
+def get_version(namespace: str):
+    """Return (version, generation); version is None when it must be recomputed."""
+    with _lock:
+        _cache_for(namespace)
+        return _versions.get(namespace), _generations[namespace]
+
+
+def store_version(namespace: str, generation: int, version: str) -> None:
+    with _lock:
+        if _generations[namespace] == generation:
+            _versions[namespace] = version
+
+
+def invalidate(namespace: str) -> None:
+    """Drop every cached entry of a namespace (call after a committed write)."""
+    with _lock:
+        _cache_for(namespace).clear()
+        _versions.pop(namespace, None)
+        _generations[namespace] += 1
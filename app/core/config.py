@@ -1,5 +1,6 @@
 # app/core/config.py
 import os
+from dataclasses import dataclass
 from dynaconf import Dynaconf
 
 BASE_DIR = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
@@ -13,3 +14,41 @@ settings = Dynaconf(
     merge_enabled=True,
     env="development",
 )
+
+
+def _split_origins(value) -> list[str]:
+    """CORS_ORIGINS as a list; a plain string is a comma-separated list."""
+    if isinstance(value, str):
+        return [origin.strip() for origin in value.split(",") if origin.strip()]
+    return list(value)
+
+
+@dataclass(frozen=True, slots=True)
+class Config:
+    """Settings resolved once at import; read these instead of `settings.X`."""
+    database_url: str
+    db_pool_size: int
+    db_max_overflow: int
+    pgbouncer_mode: str
+    cors_origins: list[str]
+    lookup_cache_ttl: int
+    lookup_etag_ttl: int
+
+    @classmethod
+    def from_settings(cls, settings) -> "Config":
+        """Read and normalize every field from a Dynaconf settings object."""
+        return cls(
+            database_url=str(settings.DATABASE_URL),
+            db_pool_size=int(settings.get("DB_POOL_SIZE", 20)),
+            db_max_overflow=int(settings.get("DB_MAX_OVERFLOW", 10)),
+            # "transaction" when the app connects through PgBouncer in transaction mode
+            pgbouncer_mode=str(settings.get("PGBOUNCER_MODE", "")),
+            # env vars arrive as strings ("https://a.example,https://b.example")
+            cors_origins=_split_origins(settings.get("CORS_ORIGINS", ["*"])),
+            lookup_cache_ttl=int(settings.get("LOOKUP_CACHE_TTL", 300)),
+            lookup_etag_ttl=int(settings.get("LOOKUP_ETAG_TTL", 10)),
+        )
+
+
+# A missing DATABASE_URL fails here, at boot, not on the first request
+cfg = Config.from_settings(settings)
@@ -0,0 +1,42 @@
+# app/core/warmup.py
+import uuid
+
+from sqlalchemy import bindparam, select, text
+from sqlalchemy.orm import configure_mappers, raiseload
+
+from app.api.deps import table_version
+from app.database import AsyncSessionLocal, engine
+from app.models.contact import Contact
+from app.models.lookup_models import Department, Location, Status, Unit, Vertical
+from app.models.project import Project
+
+LOOKUP_MODELS = (Department, Unit, Vertical, Location, Status)
+
+# Never matches a row; only the statement shape matters
+_NO_ID = uuid.UUID(int=0)
+
+
+async def warm_up() -> None:
+    """
+    Pay the one-off costs before the first request instead of during it:
+    mapper configuration, the first pooled connection of each engine, and
+    compiling the hot read statements into SQLAlchemy's statement cache.
+
+    The statements mirror what the routers build (the cache is keyed on
+    statement structure, not on bound values), so later requests reuse the
+    compiled SQL.
+    """
+    configure_mappers()
+
+    with engine.connect() as conn:
+        conn.execute(text("SELECT 1"))
+
+    async with AsyncSessionLocal() as db:
+        for model in LOOKUP_MODELS:
+            # Version token, list page and by-id, as in make_lookup_router
+            await db.execute(table_version(model))
+            await db.scalars(select(model).order_by(model.id).limit(0))
+            await db.scalar(select(model).where(model.id == bindparam("item_id")), {"item_id": _NO_ID})
+
+        for model in (Contact, Project):
+            await db.scalars(select(model).options(raiseload("*")).order_by(model.id).limit(0))
@@ -1,18 +1,58 @@
+from uuid import uuid4
+
 from sqlalchemy import create_engine
+from sqlalchemy.engine import make_url
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 from sqlalchemy.orm import sessionmaker, declarative_base
-from app.core.config import settings
+from sqlalchemy.pool import NullPool
+from app.core.config import cfg
 
-SQLALCHEMY_DATABASE_URL = settings.DATABASE_URL
+SQLALCHEMY_DATABASE_URL = cfg.database_url
 
+# Liveness comes from pool_recycle rather than pool_pre_ping (no extra
+# SELECT 1 per checkout); LIFO keeps a small set of connections warm.
 engine = create_engine(
     SQLALCHEMY_DATABASE_URL,
-    pool_size=20,
-    max_overflow=10,
+    pool_size=cfg.db_pool_size,
+    max_overflow=cfg.db_max_overflow,
     pool_timeout=30,
     pool_recycle=1800,
+    pool_use_lifo=True,
+    # multi-row VALUES for bulk INSERTs, execute_batch for bulk UPDATE/DELETE
+    executemany_mode="values_plus_batch",
+    insertmanyvalues_page_size=1000,
 )
 
-SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+SessionLocal = sessionmaker(autocommit=False, autoflush=False, expire_on_commit=False, bind=engine)
+
+# Same database through asyncpg, for routers with async endpoints. Behind
+# PgBouncer in transaction mode the bouncer does the pooling, and server
+# connections change between transactions, so prepared statements can't be
+# cached either, and each one gets a unique name so two clients never collide
+# on asyncpg's default numbered names on one server connection.
+ASYNC_DATABASE_URL = make_url(SQLALCHEMY_DATABASE_URL).set(drivername="postgresql+asyncpg")
+
+if cfg.pgbouncer_mode == "transaction":
+    async_engine = create_async_engine(
+        ASYNC_DATABASE_URL,
+        poolclass=NullPool,
+        connect_args={
+            "statement_cache_size": 0,
+            "prepared_statement_cache_size": 0,
+            "prepared_statement_name_func": lambda: f"__asyncpg_{uuid4()}__",
+        },
+    )
+else:
+    async_engine = create_async_engine(
+        ASYNC_DATABASE_URL,
+        pool_size=cfg.db_pool_size,
+        max_overflow=cfg.db_max_overflow,
+        pool_timeout=30,
+        pool_recycle=1800,
+        pool_use_lifo=True,
+    )
+
+AsyncSessionLocal = async_sessionmaker(async_engine, autoflush=False, expire_on_commit=False)
 
 Base = declarative_base()
 
@@ -23,3 +63,8 @@ def get_db():
         yield db
     finally:
         db.close()
+
+
+async def get_async_db():
+    async with AsyncSessionLocal() as db:
+        yield db
@@ -1,7 +1,14 @@
+from contextlib import asynccontextmanager
+
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse
 import uvicorn
 
+from app.core.config import cfg
+from app.core.warmup import warm_up
+from app.database import async_engine
+
 # Routers
 from app.api.v1 import (
     accounts,
@@ -16,6 +23,16 @@ from app.api.v1 import (
     contact
 )
 
+# --------------------------
+# Startup / shutdown
+# --------------------------
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    await warm_up()
+    yield
+    await async_engine.dispose()
+
+
 # --------------------------
 # Create FastAPI App
 # --------------------------
@@ -23,18 +40,28 @@ app = FastAPI(
     title="iApps Account Management API",
     version="1.0.0",
     description="Client Accounts, Projects, Contacts, and Lookup Management System",
+    # orjson encodes the audit-heavy list payloads far faster than stdlib json
+    default_response_class=ORJSONResponse,
+    lifespan=lifespan,
 )
 
 
 # --------------------------
 # CORS (Required for frontend)
 # --------------------------
+# Set CORS_ORIGINS to the frontend domain(s) in production, as a list or a
+# comma-separated string. Credentials are only allowed for an explicit list:
+# with "*" Starlette would echo back any origin. Preflights are answered
+# here, before routing or any DB dependency.
+CORS_ORIGINS = cfg.cors_origins
+
 app.add_middleware(
     CORSMiddleware,
-    allow_origins=["*"],  # Change to your frontend domain in production
-    allow_credentials=True,
+    allow_origins=CORS_ORIGINS,
+    allow_credentials="*" not in CORS_ORIGINS,
     allow_methods=["*"],
     allow_headers=["*"],
+    max_age=7200,  # let browsers reuse a preflight for 2h (Chromium's cap)
 )
 
 
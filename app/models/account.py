@@ -1,12 +1,17 @@
 import uuid
-from sqlalchemy import Column, String, DateTime, Boolean, ForeignKey, Integer
-from sqlalchemy.sql import func
+from sqlalchemy import Column, String, ForeignKey, Integer, Index, text
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import relationship
 from app.database import Base # Assuming 'Base' is imported
+from app.models.audit import AuditMixin
 
-class Account(Base):
+class Account(AuditMixin, Base):
     __tablename__ = "accounts"
+    # Live accounts per lookup value (lookup -> accounts loads, "in use" checks)
+    __table_args__ = tuple(
+        Index(f"idx_accounts_active_{fk}", f"{fk}_id", postgresql_where=text("is_deleted = false"))
+        for fk in ("department", "unit", "vertical", "location", "status")
+    )
 
     # Primary Key
     id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
@@ -25,16 +30,14 @@ class Account(Base):
     location_id = Column(UUID(as_uuid=True), ForeignKey("locations.id"), nullable=True)
     status_id = Column(UUID(as_uuid=True), ForeignKey("statuses.id"), nullable=True)
 
+    # Lookups (many-to-one); load them per query, e.g. selectinload(Account.department)
+    department = relationship("Department", back_populates="accounts")
+    unit = relationship("Unit", back_populates="accounts")
+    vertical = relationship("Vertical", back_populates="accounts")
+    location = relationship("Location", back_populates="accounts")
+    status = relationship("Status", back_populates="accounts")
+
     # Relationships 
     projects = relationship("Project", back_populates="account", cascade="all, delete-orphan")
     contacts = relationship("Contact", back_populates="account", cascade="all, delete-orphan")
     billing_address = relationship("Address", uselist=False, back_populates="account", cascade="all, delete-orphan")
-
-    # Audit Columns
-    created_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
-    updated_at = Column(DateTime(timezone=True), onupdate=func.now())
-    is_deleted = Column(Boolean, default=False, nullable=False, index=True)
-    deleted_at = Column(DateTime(timezone=True))
-    created_by = Column(UUID(as_uuid=True), nullable=False)
-    updated_by = Column(UUID(as_uuid=True))
-    deleted_by = Column(UUID(as_uuid=True))
\ No newline at end of file
@@ -1,11 +1,11 @@
 import uuid
-from sqlalchemy import Column, String, DateTime, Boolean, ForeignKey
-from sqlalchemy.sql import func
+from sqlalchemy import Column, String, ForeignKey
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import relationship
 from app.database import Base # Assuming 'Base' is imported
+from app.models.audit import AuditMixin
 
-class Address(Base):
+class Address(AuditMixin, Base):
     __tablename__ = "addresses"
     
     # PK is also the FK to Account (one-to-one mapping)
@@ -21,12 +21,3 @@ class Address(Base):
     
     # Relationship
     account = relationship("Account", back_populates="billing_address")
-
-    # Audit Columns
-    created_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
-    updated_at = Column(DateTime(timezone=True), onupdate=func.now())
-    is_deleted = Column(Boolean, default=False, nullable=False, index=True)
-    deleted_at = Column(DateTime(timezone=True))
-    created_by = Column(UUID(as_uuid=True), nullable=False)
-    updated_by = Column(UUID(as_uuid=True))
-    deleted_by = Column(UUID(as_uuid=True))
\ No newline at end of file
@@ -0,0 +1,50 @@
+from sqlalchemy import Column, DateTime, Boolean, event
+from sqlalchemy.sql import func
+from sqlalchemy.dialects.postgresql import UUID
+from sqlalchemy.orm import Session, with_loader_criteria
+
+
+class AuditMixin:
+    """Audit columns shared by every table.
+
+    updated_at is stamped by onupdate on any UPDATE (ORM flush or update()
+    statement), so handlers only set the *_by columns and deleted_at.
+    """
+    created_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
+    updated_at = Column(DateTime(timezone=True), onupdate=func.now())
+    # No index of its own: too few distinct values; tables carry partial
+    # `WHERE is_deleted = false` indexes instead
+    is_deleted = Column(Boolean, default=False, nullable=False)
+    deleted_at = Column(DateTime(timezone=True))
+    created_by = Column(UUID(as_uuid=True), nullable=False)
+    updated_by = Column(UUID(as_uuid=True))
+    deleted_by = Column(UUID(as_uuid=True))
+
+
+@event.listens_for(Session, "do_orm_execute")
+def _hide_soft_deleted(execute_state):
+    """Add `is_deleted = false` for every audited entity in ORM SELECTs.
+
+    Relationship and column loads inherit the criteria from the statement that
+    loaded the parent, so soft-deleted children vanish from the loaded object
+    too: an account's deleted contacts and projects are not in its lists, a
+    deleted lookup or address loads as None (null in responses, blank in
+    exports). Pass execution_options(include_deleted=True) to opt out, e.g.
+    to count deleted rows or to reach a deleted row that must be restored.
+    The predicate stays `= false` (not IS false) so the partial indexes on
+    live rows still match. UPDATE/DELETE and INSERT ... SELECT keep their own
+    explicit filters.
+    """
+    if (
+        execute_state.is_select
+        and not execute_state.is_column_load
+        and not execute_state.is_relationship_load
+        and not execute_state.execution_options.get("include_deleted", False)
+    ):
+        execute_state.statement = execute_state.statement.options(
+            with_loader_criteria(
+                AuditMixin,
+                lambda cls: cls.is_deleted == False,
+                include_aliases=True,
+            )
+        )
@@ -1,92 +1,68 @@
 import uuid
-from sqlalchemy import Column, String, DateTime, Boolean
-from sqlalchemy.sql import func
+from sqlalchemy import Column, String, Index, text
 from sqlalchemy.dialects.postgresql import UUID
 from app.database import Base # Assuming 'Base' is imported
+from app.models.audit import AuditMixin
 from sqlalchemy.orm import relationship 
 
-class Department(Base):
+class Department(AuditMixin, Base):
     __tablename__ = "departments"
+    # Names are unique among live rows only, so a soft-deleted name can be reused
+    __table_args__ = (
+        Index("idx_departments_active_name", "name", unique=True, postgresql_where=text("is_deleted = false")),
+    )
     # Primary Key
     id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
-    name = Column(String, nullable=False, unique=True)
-    
-    # Audit Columns
-    created_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
-    updated_at = Column(DateTime(timezone=True), onupdate=func.now())
-    is_deleted = Column(Boolean, default=False, nullable=False, index=True)
-    deleted_at = Column(DateTime(timezone=True))
-    created_by = Column(UUID(as_uuid=True), nullable=False)
-    updated_by = Column(UUID(as_uuid=True))
-    deleted_by = Column(UUID(as_uuid=True))  
-    
-    accounts = relationship("Account", backref="department")
+    name = Column(String, nullable=False)
+
+    # Never loaded implicitly; a lookup value can have thousands of accounts
+    accounts = relationship("Account", back_populates="department", lazy="raise")
     
 
-class Unit(Base):
+class Unit(AuditMixin, Base):
     __tablename__ = "units"
+    # Names are unique among live rows only, so a soft-deleted name can be reused
+    __table_args__ = (
+        Index("idx_units_active_name", "name", unique=True, postgresql_where=text("is_deleted = false")),
+    )
     # Primary Key
     id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
-    name = Column(String, nullable=False, unique=True)
-    
-    # Audit Columns
-    created_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
-    updated_at = Column(DateTime(timezone=True), onupdate=func.now())
-    is_deleted = Column(Boolean, default=False, nullable=False, index=True)
-    deleted_at = Column(DateTime(timezone=True))
-    created_by = Column(UUID(as_uuid=True), nullable=False)
-    updated_by = Column(UUID(as_uuid=True))
-    deleted_by = Column(UUID(as_uuid=True)) 
+    name = Column(String, nullable=False)
 
-    accounts = relationship("Account", backref="unit")
+    accounts = relationship("Account", back_populates="unit", lazy="raise")
 
-class Vertical(Base):
+class Vertical(AuditMixin, Base):
     __tablename__ = "verticals"
+    # Names are unique among live rows only, so a soft-deleted name can be reused
+    __table_args__ = (
+        Index("idx_verticals_active_name", "name", unique=True, postgresql_where=text("is_deleted = false")),
+    )
     # Primary Key
     id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
-    name = Column(String, nullable=False, unique=True)
-    
-    # Audit Columns
-    created_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
-    updated_at = Column(DateTime(timezone=True), onupdate=func.now())
-    is_deleted = Column(Boolean, default=False, nullable=False, index=True)
-    deleted_at = Column(DateTime(timezone=True))
-    created_by = Column(UUID(as_uuid=True), nullable=False)
-    updated_by = Column(UUID(as_uuid=True))
-    deleted_by = Column(UUID(as_uuid=True)) 
+    name = Column(String, nullable=False)
 
-    accounts = relationship("Account", backref="vertical")
+    accounts = relationship("Account", back_populates="vertical", lazy="raise")
 
-class Location(Base):
+class Location(AuditMixin, Base):
     __tablename__ = "locations"
+    # Names are unique among live rows only, so a soft-deleted name can be reused
+    __table_args__ = (
+        Index("idx_locations_active_name", "name", unique=True, postgresql_where=text("is_deleted = false")),
+    )
     # Primary Key
     id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
-    name = Column(String, nullable=False,unique=True)
-    
-    # Audit Columns
-    created_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
-    updated_at = Column(DateTime(timezone=True), onupdate=func.now())
-    is_deleted = Column(Boolean, default=False, nullable=False, index=True)
-    deleted_at = Column(DateTime(timezone=True))
-    created_by = Column(UUID(as_uuid=True), nullable=False)
-    updated_by = Column(UUID(as_uuid=True))
-    deleted_by = Column(UUID(as_uuid=True)) 
+    name = Column(String, nullable=False)
 
-    accounts = relationship("Account", backref="location")
+    accounts = relationship("Account", back_populates="location", lazy="raise")
 
-class Status(Base):
+class Status(AuditMixin, Base):
     __tablename__ = "statuses"
+    # Names are unique among live rows only, so a soft-deleted name can be reused
+    __table_args__ = (
+        Index("idx_statuses_active_name", "name", unique=True, postgresql_where=text("is_deleted = false")),
+    )
     # Primary Key
     id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
-    name = Column(String, nullable=False,unique=True)
-    
-    # Audit Columns
-    created_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
-    updated_at = Column(DateTime(timezone=True), onupdate=func.now())
-    is_deleted = Column(Boolean, default=False, nullable=False, index=True)
-    deleted_at = Column(DateTime(timezone=True))
-    created_by = Column(UUID(as_uuid=True), nullable=False)
-    updated_by = Column(UUID(as_uuid=True))
-    deleted_by = Column(UUID(as_uuid=True)) 
+    name = Column(String, nullable=False)
 
-    accounts = relationship("Account", backref="status")
\ No newline at end of file
+    accounts = relationship("Account", back_populates="status", lazy="raise")
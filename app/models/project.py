@@ -1,12 +1,21 @@
 import uuid
-from sqlalchemy import Column, String, DateTime, Boolean, ForeignKey, Float
-from sqlalchemy.sql import func
+from sqlalchemy import Column, String, DateTime, ForeignKey, Float, Index, text
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import relationship
 from app.database import Base # Assuming 'Base' is imported
+from app.models.audit import AuditMixin
 
-class Project(Base):
+class Project(AuditMixin, Base):
     __tablename__ = "projects"
+    __table_args__ = (
+        Index(
+            "idx_projects_active_code",
+            "project_code",
+            unique=True,
+            postgresql_where=text("is_deleted = false AND project_code IS NOT NULL"),
+        ),
+        Index("idx_projects_active_account", "account_id", postgresql_where=text("is_deleted = false")),
+    )
 
     # Primary Key
     id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
@@ -25,12 +34,3 @@ class Project(Base):
     # Foreign Key - Set to nullable=True as requested for initial optionality
     account_id = Column(UUID(as_uuid=True), ForeignKey("accounts.id"), nullable=False) 
     account = relationship("Account", back_populates="projects")
-
-    # Audit Columns
-    created_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
-    updated_at = Column(DateTime(timezone=True), onupdate=func.now())
-    is_deleted = Column(Boolean, default=False, nullable=False, index=True)
-    deleted_at = Column(DateTime(timezone=True))
-    created_by = Column(UUID(as_uuid=True), nullable=False)
-    updated_by = Column(UUID(as_uuid=True))
-    deleted_by = Column(UUID(as_uuid=True))
\ No newline at end of file
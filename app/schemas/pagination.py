@@ -0,0 +1,11 @@
+from typing import Generic, List, Optional, TypeVar
+from uuid import UUID
+from pydantic import BaseModel
+
+T = TypeVar("T")
+
+
+class Page(BaseModel, Generic[T]):
+    """One page of a keyset-paginated list; pass next_cursor back as ?cursor."""
+    items: List[T]
+    next_cursor: Optional[UUID] = None
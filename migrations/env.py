@@ -8,14 +8,14 @@ import sys
 sys.path.append(os.path.dirname(os.path.dirname(__file__)))
 
 from app.database import Base
-from app.core.config import settings
+from app.core.config import cfg
 from app import models  # make sure models are imported
 
 # Alembic Config
 config = context.config
 
 # Correct database URL assignment
-config.set_main_option("sqlalchemy.url", settings.DATABASE_URL)
+config.set_main_option("sqlalchemy.url", cfg.database_url)
 
 # Logging
 if config.config_file_name is not None:
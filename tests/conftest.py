@@ -0,0 +1,54 @@
+import os
+
+import pytest
+from sqlalchemy import event
+from sqlalchemy.exc import OperationalError
+from sqlalchemy.orm import Session, raiseload
+
+# app.core.config builds `cfg` at import and requires a database URL; tests
+# that never touch the database only need it to be set
+os.environ.setdefault("DYNACONF_DATABASE_URL", "postgresql://localhost/test")
+
+
+@pytest.fixture
+def db():
+    """
+    Sync session on the configured (migrated) database. Everything it writes,
+    commits included, is rolled back afterwards; skips without a database.
+    """
+    from app.database import engine
+
+    try:
+        conn = engine.connect()
+    except OperationalError:
+        pytest.skip("database not reachable")
+
+    outer = conn.begin()
+    session = Session(bind=conn, join_transaction_mode="create_savepoint")
+    try:
+        yield session
+    finally:
+        session.close()
+        outer.rollback()
+        conn.close()
+
+
+@pytest.fixture
+def raise_on_lazy_load():
+    """
+    Add raiseload("*") to every top-level ORM SELECT while the test runs, so
+    any relationship a query did not load explicitly raises when touched.
+    """
+    def add_raiseload(execute_state):
+        if (
+            execute_state.is_select
+            and not execute_state.is_column_load
+            and not execute_state.is_relationship_load
+        ):
+            execute_state.statement = execute_state.statement.options(raiseload("*"))
+
+    event.listen(Session, "do_orm_execute", add_raiseload)
+    try:
+        yield
+    finally:
+        event.remove(Session, "do_orm_execute", add_raiseload)
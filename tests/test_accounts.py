@@ -0,0 +1,43 @@
+import uuid
+
+import pytest
+from sqlalchemy import select
+from sqlalchemy.exc import InvalidRequestError
+
+from app.api.v1.accounts import get_account_by_id
+from app.models.account import Account
+from app.models.address import Address
+from app.models.contact import Contact
+from app.models.project import Project
+from app.schemas.account import Account as AccountSchema
+
+USER_ID = uuid.UUID(int=1)
+
+
+@pytest.fixture
+def account_id(db):
+    account = Account(name="Acme", code=f"test-{uuid.uuid4()}", created_by=USER_ID)
+    db.add(account)
+    db.flush()
+    db.add_all([
+        Address(account_id=account.id, addressLine1="1 Main St", city="Pune", countryCode="IN", created_by=USER_ID),
+        Contact(name="Asha", email="asha@example.com", account_id=account.id, created_by=USER_ID),
+        Project(project_name="Rollout", account_id=account.id, created_by=USER_ID),
+    ])
+    db.flush()
+    db.expunge_all()
+    return account.id
+
+
+def test_fixture_raises_on_unloaded_relationship(db, account_id, raise_on_lazy_load):
+    account = db.scalar(select(Account).where(Account.id == account_id))
+    with pytest.raises(InvalidRequestError):
+        account.contacts
+
+
+def test_account_read_serializes_without_lazy_loads(db, account_id, raise_on_lazy_load):
+    body = AccountSchema.model_validate(get_account_by_id(account_id, db)).model_dump()
+
+    assert body["billing_address"]["city"] == "Pune"
+    assert [c["name"] for c in body["contacts"]] == ["Asha"]
+    assert [p["project_name"] for p in body["projects"]] == ["Rollout"]
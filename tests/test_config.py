@@ -0,0 +1,25 @@
+from dynaconf import Dynaconf
+
+from app.core.config import Config
+
+
+def make_config(**values) -> Config:
+    return Config.from_settings(Dynaconf(DATABASE_URL="postgresql://localhost/test", **values))
+
+
+def test_cors_origins_default_to_wildcard():
+    assert make_config().cors_origins == ["*"]
+
+
+def test_cors_origins_from_single_string():
+    assert make_config(CORS_ORIGINS="https://a.example").cors_origins == ["https://a.example"]
+
+
+def test_cors_origins_from_comma_separated_string():
+    cfg = make_config(CORS_ORIGINS=" https://a.example, https://b.example ,")
+    assert cfg.cors_origins == ["https://a.example", "https://b.example"]
+
+
+def test_cors_origins_from_list():
+    cfg = make_config(CORS_ORIGINS=["https://a.example", "https://b.example"])
+    assert cfg.cors_origins == ["https://a.example", "https://b.example"]
@@ -0,0 +1,30 @@
+import uuid
+
+import pytest
+from sqlalchemy.exc import InvalidRequestError
+
+from app.api.v1.projects import _GET_PROJECT_BY_ID
+from app.models.account import Account
+from app.models.project import Project
+from app.schemas.project import Project as ProjectSchema
+
+USER_ID = uuid.UUID(int=1)
+
+
+def test_project_schema_serializes_without_lazy_loads(db):
+    account = Account(name="Acme", code=f"test-{uuid.uuid4()}", created_by=USER_ID)
+    db.add(account)
+    db.flush()
+    project = Project(project_name="Rollout", account_id=account.id, created_by=USER_ID)
+    db.add(project)
+    db.flush()
+    db.expunge_all()
+
+    # The statement get_project_by_id runs; every relationship is raiseload
+    loaded = db.scalar(_GET_PROJECT_BY_ID, {"project_id": project.id})
+    with pytest.raises(InvalidRequestError):
+        loaded.account
+
+    body = ProjectSchema.model_validate(loaded).model_dump()
+    assert body["id"] == project.id
+    assert body["account_id"] == account.id